@@ -1,15 +1,17 @@
 # app.py - Advanced Thorium GenAI Platform (debugged + resilient)
 import streamlit as st
 import openai
-import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import time
 import os
 import json
+import copy
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from reactor_physics import reactor_outputs
 
 
 
@@ -49,8 +51,12 @@ except Exception as e:
         def get_user_simulations(user_id):
             return []
 
+        @staticmethod
+        def get_simulation_summary(user_id, sim_type, field, since=None):
+            return {'runs': 0, 'average': None}
+
 try:
-    from database import db_manager
+    from database import db_manager, USER_DATA_TTL, cached_user_stats, cached_export_history, clear_user_caches
 except Exception:
     class db_manager:
         @staticmethod
@@ -73,6 +79,17 @@ except Exception:
         def get_user_stats_display(user_id):
             st.write("User stats placeholder")
 
+    USER_DATA_TTL = 30  # seconds
+
+    def cached_user_stats(user_id):
+        return db_manager.get_user_stats(user_id)
+
+    def cached_export_history(user_id):
+        return db_manager.get_export_history(user_id)
+
+    def clear_user_caches():
+        pass
+
 try:
     from export_utils import show_export_options, prepare_simulation_data, export_manager
 except Exception:
@@ -95,11 +112,14 @@ except Exception:
         st.info("Realtime insights placeholder")
 
 try:
-    from mobile_styles import optimize_for_mobile, show_mobile_navigation, create_mobile_friendly_metrics
+    from mobile_styles import optimize_for_mobile, add_deferred_mobile_css, show_mobile_navigation, create_mobile_friendly_metrics
 except Exception:
     def optimize_for_mobile():
         pass
 
+    def add_deferred_mobile_css():
+        pass
+
     def show_mobile_navigation():
         pass
 
@@ -109,284 +129,248 @@ except Exception:
 # ========================
 # Load OpenAI API key (non-fatal)
 # ========================
-api_key = os.getenv("OPENAI_API_KEY") or (st.secrets.get("OPENAI_API_KEY") if hasattr(st, "secrets") else None)
+@st.cache_resource
+def get_openai_api_key():
+    # Resolved once per process: the env lookup and the secrets.toml read are skipped on later reruns
+    return os.getenv("OPENAI_API_KEY") or (st.secrets.get("OPENAI_API_KEY") if hasattr(st, "secrets") else None)
+
+api_key = get_openai_api_key()
 if api_key:
     try:
         openai.api_key = api_key
     except Exception:
         # don't crash; API might be set differently
         pass
-else:
-    # Non-fatal warning: features depending on OpenAI will show an error on use
-    if not st.session_state.get("openai_missing_warning_shown", False):
-        st.warning("⚠️ OPENAI_API_KEY not found. Knowledge Assistant will be disabled until you add a key to Streamlit Secrets or set OPENAI_API_KEY as an environment variable.")
-        st.session_state["openai_missing_warning_shown"] = True
+elif "openai_missing_warning_shown" not in st.session_state:
+    # Non-fatal warning, shown once per session: features depending on OpenAI will show an error on use
+    st.session_state["openai_missing_warning_shown"] = True
+    st.warning("⚠️ OPENAI_API_KEY not found. Knowledge Assistant will be disabled until you add a key to Streamlit Secrets or set OPENAI_API_KEY as an environment variable.")
 
 # ========================
 # Custom CSS for professional styling (kept from your original)
 # ========================
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Main theme colors */
-    :root {
-        --primary-color: #1f77b4;
-        --secondary-color: #ff7f0e;
-        --success-color: #2ca02c;
-        --warning-color: #d62728;
-        --background-color: #f8f9fa;
-        --card-background: #ffffff;
-        --text-primary: #2c3e50;
-        --text-secondary: #6c757d;
-        --border-color: #e9ecef;
-        --shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    
-    /* Global styles */
-    .main {
-        font-family: 'Inter', sans-serif;
-        background-color: var(--background-color);
-    }
-    
-    /* Header styling */
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem 1rem;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        text-align: center;
-        color: white;
-        box-shadow: var(--shadow);
-    }
-    
-    .main-header h1 {
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin: 0;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .main-header p {
-        font-size: 1.1rem;
-        margin: 0.5rem 0 0 0;
-        opacity: 0.9;
-    }
-    
-    /* Card styling */
-    .metric-card {
-        background: var(--card-background);
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: var(--shadow);
-        border-left: 4px solid var(--primary-color);
-        margin: 1rem 0;
-    }
-    
-    .metric-value {
-        font-size: 2rem;
-        font-weight: 700;
-        color: var(--primary-color);
-        margin: 0;
-    }
-    
-    .metric-label {
-        font-size: 0.9rem;
-        color: var(--text-secondary);
-        margin: 0;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(45deg, var(--primary-color), var(--secondary-color));
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.5rem 1.5rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: var(--shadow);
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-    }
-    
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-        background-color: var(--background-color);
-        border-radius: 10px;
-        padding: 5px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background-color: transparent;
-        border-radius: 8px;
-        padding: 0.75rem 1.25rem;
-        font-weight: 600;
-        font-size: 16px;
-        transition: all 0.3s ease;
-        min-width: 200px;
-        height: 60px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        text-align: center;
-        white-space: nowrap;
-        border: 2px solid transparent;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    /* Ensure tab text is visible */
-    .stTabs [data-baseweb="tab"] span {
-        display: inline-block;
-        margin-left: 0.5rem;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #1f77b4 0%, #ff7f0e 100%);
-        color: white;
-        box-shadow: 0 6px 20px rgba(31, 119, 180, 0.4);
-        border-color: #1f77b4;
-        transform: translateY(-1px);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stTabs [aria-selected="true"]:before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: linear-gradient(45deg, rgba(255,255,255,0.1) 0%, transparent 50%, rgba(255,255,255,0.1) 100%);
-        animation: shimmer 2s infinite;
-    }
-    
-    @keyframes shimmer {
-        0% { transform: translateX(-100%); }
-        100% { transform: translateX(100%); }
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background-color: rgba(31, 119, 180, 0.15);
-        transform: translateY(-2px);
-        border-color: rgba(31, 119, 180, 0.3);
-        box-shadow: 0 4px 15px rgba(31, 119, 180, 0.2);
-        transform: translateY(-1px);
-    }
-    
-    /* Sidebar styling */
-    .sidebar .sidebar-content {
-        background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
-        color: white;
-    }
-    
-    /* Slider styling */
-    .stSlider > div > div > div > div {
-        background: var(--primary-color);
-    }
-    
-    /* Success/Error message styling */
-    .stSuccess {
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        border-radius: 8px;
-        padding: 1rem;
-    }
-    
-    .stError {
-        background-color: #f8d7da;
-        border: 1px solid #f5c6cb;
-        border-radius: 8px;
-        padding: 1rem;
-    }
-    
-    /* Loading spinner */
-    .spinner {
-        border: 4px solid #f3f3f3;
-        border-top: 4px solid var(--primary-color);
-        border-radius: 50%;
-        width: 40px;
-        height: 40px;
-        animation: spin 1s linear infinite;
-        margin: 20px auto;
-    }
-    
-    @keyframes spin {
-        0% { transform: rotate(0deg); }
-        100% { transform: rotate(360deg); }
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Ensure all text is visible */
-    .stButton > button {
-        font-size: 14px !important;
-        font-weight: 600 !important;
-    }
-    
-    /* Make sure sidebar text is visible with enhanced highlighting */
-    .sidebar .stButton > button {
-        width: 100%;
-        margin: 0.25rem 0;
-        text-align: left;
-        padding: 0.75rem 1rem;
-        border: 2px solid transparent;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .sidebar .stButton > button:hover {
-        transform: translateX(5px);
-        border-color: rgba(31, 119, 180, 0.3);
-        box-shadow: 0 4px 12px rgba(31, 119, 180, 0.2);
-    }
-    
-    .sidebar .stButton > button:active {
-        background: linear-gradient(135deg, #1f77b4 0%, #ff7f0e 100%);
-        transform: translateX(3px);
-    }
-    
-    /* Ensure metric labels are visible */
-    .metric-label {
-        font-size: 0.9rem !important;
-        font-weight: 500 !important;
-        color: var(--text-secondary) !important;
-    }
-    
-    /* Make sure all headings have proper spacing */
-    h1, h2, h3, h4, h5, h6 {
-        margin-top: 1rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+APP_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "thorium.css")
+
+@st.cache_resource
+def load_css(path):
+    """Read a stylesheet once per process; app.py itself re-executes on every rerun"""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+def inject_app_css():
+    # Streamlit removes any element that is not emitted again on a rerun, so the
+    # stylesheet is sent every run rather than once per session.
+    try:
+        st.markdown(f"<style>{load_css(APP_CSS_PATH)}</style>", unsafe_allow_html=True)
+    except OSError:
+        pass
+
+inject_app_css()
+
+# ========================
+# Background persistence: DB writes that the UI does not wait on
+# ========================
+@st.cache_resource
+def get_persist_pool():
+    # Cached so every rerun and session shares the same two worker threads
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="thorium-persist")
+
+def _run_quietly(func, *args):
+    try:
+        func(*args)
+    except Exception:
+        pass
+
+def persist_in_background(func, *args):
+    """Queue a save/log call on the worker pool; errors are swallowed like the inline calls were"""
+    get_persist_pool().submit(_run_quietly, func, *args)
+
+def log_event(user_id, action_type, page_name, metadata=None):
+    """Record an analytics event; log_analytics only enqueues it for the database writer thread"""
+    db_manager.log_analytics(user_id, action_type, page_name, st.session_state.get('session_id', 'unknown'), metadata)
+
+# ========================
+# Cached per-user reads (stats and export history live in database.py with their invalidation)
+# ========================
+@st.cache_data(ttl=USER_DATA_TTL, show_spinner=False)
+def cached_user_simulations(user_id):
+    return auth_manager.get_user_simulations(user_id)
+
+@st.cache_data(ttl=USER_DATA_TTL, show_spinner=False)
+def cached_reactor_summary(user_id):
+    # Count and average are aggregated in SQLite, so the analytics view never loads the saved runs
+    return auth_manager.get_simulation_summary(user_id, "reactor", "yearly_output")
+
+def save_simulation(user_id, sim_type, params, results):
+    """Save a simulation, then drop the cached reads it changes so the sidebar is current on the next run"""
+    auth_manager.save_simulation(user_id, sim_type, params, results)
+    cached_user_simulations.clear()
+    cached_reactor_summary.clear()
+    clear_user_caches()
 
 # ========================
-# Helper: safe OpenAI chat call
+# Helper: safe OpenAI chat calls
 # ========================
-def call_openai_chat(messages, model="gpt-3.5-turbo", max_tokens=700, temperature=0.2):
+CHAT_MODEL = "gpt-3.5-turbo"
+SYSTEM_PROMPT = "You are a nuclear energy expert and thorium specialist. Provide detailed, accurate, and accessible answers about thorium-based reactors and India's energy future."
+
+SAMPLE_QUESTIONS = [
+    "How do thorium reactors differ from uranium reactors?",
+    "What is India's thorium program timeline?",
+    "How safe are thorium-based nuclear plants?",
+    "What are the economic benefits of thorium energy?"
+]
+
+def build_messages(question):
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": question},
+    ]
+
+BATCH_INSTRUCTIONS = (
+    "Answer each of the following {count} questions. Start every answer with a line containing only "
+    "its marker (e.g. '### Q1'), keep the answers in question order, and do not repeat the question.\n\n"
+)
+BATCH_MARKER = re.compile(r"^###\s*Q(\d+)\s*$", re.MULTILINE)
+
+def build_batch_messages(questions):
+    """Marshal several questions into one prompt so they share a request and the system prompt"""
+    marked = "\n".join(f"### Q{i}\n{q}" for i, q in enumerate(questions, 1))
+    return build_messages(BATCH_INSTRUCTIONS.format(count=len(questions)) + marked)
+
+def parse_batch_answers(text, count):
+    """Split a marked batch reply into one answer per question, or None unless it holds exactly Q1..Q<count> in order"""
+    parts = BATCH_MARKER.split(text or "")
+    numbers = [int(n) for n in parts[1::2]]
+    answers = [body.strip() for body in parts[2::2]]
+    if parts[0].strip() or numbers != list(range(1, count + 1)) or not all(answers):
+        return None
+    return answers
+
+@st.cache_resource
+def get_openai_client(api_key):
+    return openai.OpenAI(api_key=api_key)
+
+def stream_openai_chat(messages, model=CHAT_MODEL, max_tokens=700, temperature=0.2):
+    """Yield the answer text chunk by chunk as the completion streams in"""
+    if not (openai and getattr(openai, "api_key", None)):
+        raise RuntimeError("OpenAI API key not configured.")
+    client = get_openai_client(openai.api_key)
+    stream = client.chat.completions.create(model=model, messages=messages, max_tokens=max_tokens, temperature=temperature, stream=True)
+    for chunk in stream:
+        if chunk.choices:
+            yield chunk.choices[0].delta.content or ""
+
+def call_openai_chat(messages, model=CHAT_MODEL, max_tokens=700, temperature=0.2):
+    """One chat completion on the shared client; errors are raised to the caller"""
     if not (openai and getattr(openai, "api_key", None)):
         raise RuntimeError("OpenAI API key not configured.")
-    client = openai.OpenAI(api_key=openai.api_key)
-    resp = client.chat.completions.create(model=model, messages=messages, max_tokens=max_tokens, temperature=temperature)
-    return resp
+    client = get_openai_client(openai.api_key)
+    return client.chat.completions.create(model=model, messages=messages, max_tokens=max_tokens, temperature=temperature)
+
+# ========================
+# Answer cache: repeat questions (e.g. the sample questions) skip the API entirely
+# ========================
+ANSWER_CACHE_TTL = 3600  # seconds
+ANSWER_CACHE_MAX = 256  # entries; keys come from free-text questions, so the map must stay bounded
+
+class AnswerCache:
+    """Thread-safe TTL + LRU map: reads refresh recency, writes drop expired entries and then the least recently used"""
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (stored_at, answer), least recently used first
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def put(self, key, answer):
+        with self._lock:
+            now = time.time()
+            self._entries[key] = (now, answer)
+            self._entries.move_to_end(key)
+            for expired in [k for k, (stored_at, _) in self._entries.items() if now - stored_at >= self.ttl]:
+                del self._entries[expired]
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+@st.cache_resource
+def get_answer_cache():
+    # Shared across sessions; keyed by (model, prompt, normalized question)
+    return AnswerCache(ANSWER_CACHE_MAX, ANSWER_CACHE_TTL)
+
+def _answer_cache_key(model, question, prompt=SYSTEM_PROMPT):
+    return (model, prompt, " ".join(question.split()).casefold())
+
+def get_cached_answer(model, question, prompt=SYSTEM_PROMPT):
+    return get_answer_cache().get(_answer_cache_key(model, question, prompt))
+
+def store_cached_answer(model, question, answer, prompt=SYSTEM_PROMPT):
+    if answer:
+        get_answer_cache().put(_answer_cache_key(model, question, prompt), answer)
+
+def answer_question_batch(questions):
+    """Answer several questions with a single request, reusing cached answers where possible"""
+    # Answers written under the batch instructions are cached apart from single-question answers
+    batch_prompt = SYSTEM_PROMPT + BATCH_INSTRUCTIONS
+    answers = {q: get_cached_answer(CHAT_MODEL, q) or get_cached_answer(CHAT_MODEL, q, batch_prompt) for q in questions}
+    missing = [q for q in questions if not answers[q]]
+    if missing:
+        resp = call_openai_chat(build_batch_messages(missing), model=CHAT_MODEL, max_tokens=700 * len(missing))
+        parsed = parse_batch_answers(resp.choices[0].message.content, len(missing))
+        if parsed is not None:
+            for question, answer in zip(missing, parsed):
+                answers[question] = answer
+                store_cached_answer(CHAT_MODEL, question, answer, batch_prompt)
+        else:
+            # The reply could not be split reliably: ask each missing question on its own
+            for question in missing:
+                answers[question] = call_openai_chat(build_messages(question), model=CHAT_MODEL).choices[0].message.content
+                store_cached_answer(CHAT_MODEL, question, answers[question])
+    return [answers[q] for q in questions]
+
+def save_conversation(user_id, question, answer):
+    # Save conversation if user is logged in (off the script thread)
+    if user_id:
+        conversation_data = {
+            "question": question,
+            "answer": answer,
+            "timestamp": datetime.now().isoformat()
+        }
+        persist_in_background(save_simulation, user_id, "knowledge_assistant", {"question": question}, conversation_data)
+        log_event(user_id, "ai_question_asked", "knowledge_assistant", {"question_length": len(question)})
 
 # ========================
 # Knowledge Assistant Tab
 # ========================
+QUICK_FACTS = [
+    ("4x", "More Abundant", "Thorium vs Uranium reserves"),
+    ("70%", "Less Waste", "Compared to traditional reactors"),
+    ("3-4", "Years", "Average construction time"),
+]
+
+def metric_card_html(value, label, note):
+    return f"""
+        <div class="metric-card">
+            <div class="metric-value">{value}</div>
+            <div class="metric-label">{label}</div>
+            <p style="font-size: 0.8rem; margin: 0.5rem 0 0 0; color: var(--text-secondary);">{note}</p>
+        </div>
+        """
+
+def queue_sample_question():
+    question = st.session_state.get("selected_sample")
+    st.session_state.update({"sample_question": question, "sample_to_ask": question})
+
 def knowledge_assistant(user_id=None):
     st.markdown('<div class="main-header"><h1>🔬 Thorium Knowledge Assistant</h1><p>Ask intelligent questions about thorium, nuclear energy, and India\'s clean energy future</p></div>', unsafe_allow_html=True)
     
@@ -400,101 +384,167 @@ def knowledge_assistant(user_id=None):
             height=100
         )
         
+        # The button and the sample form's callback never fire in the same run, so at most one
+        # question (typed or sample) is pending
+        question = None
         if st.button("🚀 Get Expert Answer"):
             if not user_question:
                 st.warning("⚠️ Please enter a question first!")
             else:
-                if not (openai and getattr(openai, "api_key", None)):
-                    st.error("OpenAI API key missing — Knowledge Assistant disabled. Add OPENAI_API_KEY in Streamlit Secrets or environment.")
-                else:
-                    with st.spinner("🧠 Analyzing your question and generating expert response..."):
-                        try:
-                            messages = [
-                                {"role": "system", "content": "You are a nuclear energy expert and thorium specialist. Provide detailed, accurate, and accessible answers about thorium-based reactors and India's energy future."},
-                                {"role": "user", "content": user_question},
-                            ]
-                            resp = call_openai_chat(messages, model="gpt-3.5-turbo")
-                            answer = resp.choices[0].message.content
-
-                            st.markdown("### 📋 Expert Response")
-                            st.markdown(f"""
-                            <div class="metric-card">
-                                <div style="font-size: 1.1rem; line-height: 1.6; color: var(--text-primary);">
-                                    {answer}
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-
-                            # Save conversation if user is logged in
-                            try:
-                                if user_id:
-                                    conversation_data = {
-                                        "question": user_question,
-                                        "answer": answer,
-                                        "timestamp": datetime.now().isoformat()
-                                    }
-                                    auth_manager.save_simulation(user_id, "knowledge_assistant", {"question": user_question}, conversation_data)
-                                    db_manager.log_analytics(user_id, "ai_question_asked", "knowledge_assistant", st.session_state.get('session_id', 'unknown'), {"question_length": len(user_question)})
-                            except Exception:
-                                pass
-
-                        except Exception as e:
-                            st.error(f"❌ Error calling OpenAI: {e}")
+                question = user_question
+        
+        question = st.session_state.pop('sample_to_ask', None) or question
+        
+        if question and not (openai and getattr(openai, "api_key", None)):
+            st.error("OpenAI API key missing — Knowledge Assistant disabled. Add OPENAI_API_KEY in Streamlit Secrets or environment.")
+        elif question:
+            # Stream tokens so the answer starts rendering immediately
+            st.markdown("### 📋 Expert Response")
+            try:
+                answer = get_cached_answer(CHAT_MODEL, question)
+                with st.container(border=True, key="answer_card_stream"):
+                    if answer:
+                        st.markdown(answer)
+                    else:
+                        answer = st.write_stream(stream_openai_chat(build_messages(question), model=CHAT_MODEL))
+                        store_cached_answer(CHAT_MODEL, question, answer)
+                save_conversation(user_id, question, answer)
+            except Exception as e:
+                st.error(f"❌ Error calling OpenAI: {e}")
     
     with col2:
         st.markdown("### 📊 Quick Facts")
         
-        # Sample metrics cards
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">4x</div>
-            <div class="metric-label">More Abundant</div>
-            <p style="font-size: 0.8rem; margin: 0.5rem 0 0 0; color: var(--text-secondary);">Thorium vs Uranium reserves</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">70%</div>
-            <div class="metric-label">Less Waste</div>
-            <p style="font-size: 0.8rem; margin: 0.5rem 0 0 0; color: var(--text-secondary);">Compared to traditional reactors</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">3-4</div>
-            <div class="metric-label">Years</div>
-            <p style="font-size: 0.8rem; margin: 0.5rem 0 0 0; color: var(--text-secondary);">Average construction time</p>
-        </div>
-        """, unsafe_allow_html=True)
+        # Sample metrics cards, emitted as one markdown message
+        st.markdown("\n".join(metric_card_html(*fact) for fact in QUICK_FACTS), unsafe_allow_html=True)
         
         # Sample questions
         st.markdown("### 💡 Sample Questions")
-        st.markdown("*Click on any question below to use it:*")
+        st.markdown("*Pick a question below to use it:*")
         
-        sample_questions = [
-            "How do thorium reactors differ from uranium reactors?",
-            "What is India's thorium program timeline?",
-            "How safe are thorium-based nuclear plants?",
-            "What are the economic benefits of thorium energy?"
-        ]
-        
-        for i, question in enumerate(sample_questions, 1):
-            if st.button(f"❓ {question}", key=f"sample_{i}", help=f"Click to use this question"):
-                st.session_state.sample_question = question
-                st.rerun()
+        # One widget inside a form instead of a button per question. The submit callback
+        # queues the question before the script reruns, so it is answered in that same run.
+        with st.form("sample_questions_form"):
+            st.selectbox("Sample questions", SAMPLE_QUESTIONS, key="selected_sample", label_visibility="collapsed")
+            st.form_submit_button("❓ Ask This Question", on_click=queue_sample_question)
         
         if 'sample_question' in st.session_state:
-            st.text_area("Selected question:", value=st.session_state.sample_question, key="sample_input")
-            if st.button("Ask This Question"):
-                # copy sample question to main input and trigger run
-                st.session_state['sample_to_ask'] = st.session_state['sample_question']
-                st.rerun()
+            st.caption("Selected question:")
+            st.code(st.session_state.sample_question, language="text")
+        
+        if st.button("📚 Answer All Sample Questions", help="Answer every sample question in one request"):
+            if not (openai and getattr(openai, "api_key", None)):
+                st.error("OpenAI API key missing — Knowledge Assistant disabled. Add OPENAI_API_KEY in Streamlit Secrets or environment.")
+            else:
+                with st.spinner("🧠 Answering all sample questions..."):
+                    try:
+                        sample_answers = answer_question_batch(SAMPLE_QUESTIONS)
+                    except Exception as e:
+                        sample_answers = None
+                        st.error(f"❌ Error calling OpenAI: {e}")
+                if sample_answers:
+                    for question, answer in zip(SAMPLE_QUESTIONS, sample_answers):
+                        with st.expander(question):
+                            st.markdown(answer or "_No answer returned for this question._")
+                        if answer:
+                            save_conversation(user_id, question, answer)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def prepare_export_payload(simulation_type, parameters, results):
+    # Same slider values -> same payload, so repeated exports skip re-marshaling
+    return prepare_simulation_data(simulation_type, parameters, results)
 
 # ========================
 # Reactor Simulator Tab
 # ========================
+# Dashboard styling, shared by every figure build
+REACTOR_TRACES = (
+    # series key, trace name, line color, subplot row, subplot col
+    ("yearly_output", "Yearly Output", '#1f77b4', 1, 1),
+    ("cumulative_output", "Cumulative Output", '#ff7f0e', 1, 2),
+    ("efficiency_trend", "Efficiency", '#2ca02c', 2, 1),  # simulated
+    ("cost_per_mwh", "Cost/MWh", '#d62728', 2, 2),
+)
+REACTOR_LINE_STYLES = {color: dict(color=color, width=3) for _, _, color, _, _ in REACTOR_TRACES}
+REACTOR_MARKER = dict(size=8)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_reactor_outputs(fuel_input, efficiency, capacity_factor, run_time):
+    return {key: float(value) for key, value in reactor_outputs(fuel_input, efficiency, capacity_factor, run_time).items()}
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_reactor_series(run_time, yearly_output, efficiency, cost_per_mwh_estimate):
+    """Per-year series for the reactor dashboard; the RNG is seeded so the inputs fully determine the output"""
+    # Numeric hashes are not salted per process, so the seed (and the cached series) is stable across restarts
+    seed = hash((run_time, yearly_output, efficiency, cost_per_mwh_estimate)) & ((1 << 63) - 1)
+    rng = np.random.default_rng(seed)
+    # Compact dtypes: Plotly 6+ (the minimum in requirements_minimal.text) ships NumPy arrays to the browser as
+    # base64 typed arrays, so these halve the chart payload
+    years = np.arange(1, run_time + 1, dtype=np.int16)
+    return {
+        "years": years,
+        "yearly_output": np.full(run_time, yearly_output, dtype=np.float32),
+        "cumulative_output": np.float32(yearly_output) * years,  # constant yearly output, so the running total is a broadcast
+        "efficiency_trend": (efficiency + rng.normal(0, 2, size=run_time)).astype(np.float32),
+        "cost_per_mwh": (cost_per_mwh_estimate + rng.normal(0, 1, size=run_time)).astype(np.float32)
+    }
+
+@st.cache_resource
+def reactor_dashboard_template():
+    """Subplot grid, titles and axis labels for the reactor dashboard; built once per process"""
+    from plotly.subplots import make_subplots  # plotly loads on the first simulator render, not at startup
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Yearly Energy Output', 'Cumulative Energy Output', 'Efficiency Trends', 'Cost Analysis'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}],
+               [{"secondary_y": False}, {"secondary_y": False}]]
+    )
+    
+    # Update layout
+    fig.update_layout(
+        height=600,
+        showlegend=False,
+        title_text="Thorium Reactor Performance Dashboard",
+        title_x=0.5,
+        font=dict(family="Inter", size=12)
+    )
+    
+    # Update x and y axis labels
+    fig.update_xaxes(title_text="Years", row=2, col=1)
+    fig.update_xaxes(title_text="Years", row=2, col=2)
+    fig.update_yaxes(title_text="Efficiency (%)", row=2, col=1)
+    fig.update_yaxes(title_text="Cost (₹/MWh)", row=2, col=2)
+    fig.update_yaxes(title_text="Energy (GWh)", row=1, col=1)
+    fig.update_yaxes(title_text="Energy (GWh)", row=1, col=2)
+    
+    return fig
+
+@st.cache_resource(max_entries=32)
+def build_reactor_dashboard(fuel_input, efficiency, capacity_factor, run_time):
+    """Build the reactor performance dashboard; cached on the slider values so reruns reuse the figure"""
+    outputs = compute_reactor_outputs(fuel_input, efficiency, capacity_factor, run_time)
+    series = compute_reactor_series(run_time, outputs["yearly_output"], efficiency, outputs["cost_per_mwh"])
+    years = series["years"]
+    
+    import plotly.graph_objects as go
+    
+    # Start from the shared layout; only the traces depend on the sliders
+    fig = copy.deepcopy(reactor_dashboard_template())
+    
+    # One line trace per subplot; styling comes from the shared constants
+    for key, name, color, row, col in REACTOR_TRACES:
+        fig.add_trace(
+            go.Scattergl(x=years, y=series[key],
+                      mode='lines+markers', name=name,
+                      line=REACTOR_LINE_STYLES[color],
+                      marker=REACTOR_MARKER),
+            row=row, col=col
+        )
+    
+    return fig
+
+# Fragment: its own widgets rerun only this tab, not the whole app and every other figure
+@st.fragment
 def reactor_simulator(user_id=None):
     st.markdown('<div class="main-header"><h1>⚛️ Thorium Reactor Simulator</h1><p>Interactive simulation of thorium-based nuclear reactor performance and energy output</p></div>', unsafe_allow_html=True)
     
@@ -502,24 +552,27 @@ def reactor_simulator(user_id=None):
     col1, col2 = st.columns([1, 2])
     
     with col1:
-        st.markdown("### ⚙️ Reactor Parameters")
-        
-        # Reactor parameters with better styling
-        fuel_input = st.slider("Thorium Fuel Load (tons)", 1, 100, 20, help="Amount of thorium fuel loaded into the reactor")
-        efficiency = st.slider("Reactor Efficiency (%)", 30, 60, 45, help="Thermal efficiency of the reactor system")
-        run_time = st.slider("Operational Years", 1, 40, 20, help="Expected operational lifetime")
-        capacity_factor = st.slider("Capacity Factor (%)", 70, 95, 85, help="Percentage of time reactor operates at full power")
-        
-        # Additional parameters
-        st.markdown("### 🔧 Advanced Settings")
-        cooling_system = st.selectbox("Cooling System", ["Liquid Sodium", "Molten Salt", "Helium Gas"], index=1)
-        reactor_type = st.selectbox("Reactor Type", ["Fast Breeder", "Molten Salt", "Heavy Water"], index=1)
-        
-        # Calculate outputs
-        # Convert percents into fractions correctly
-        yearly_output = fuel_input * (efficiency/100.0) * (capacity_factor/100.0) * 1000  # demo scale (GWh-ish)
-        total_output = yearly_output * run_time
-        co2_saved = total_output * 0.4  # placeholder metric
+        # Form: dragging a slider no longer reruns the tab; values apply together on submit
+        with st.form("reactor_params"):
+            st.markdown("### ⚙️ Reactor Parameters")
+            
+            # Reactor parameters with better styling
+            fuel_input = st.slider("Thorium Fuel Load (tons)", 1, 100, 20, help="Amount of thorium fuel loaded into the reactor")
+            efficiency = st.slider("Reactor Efficiency (%)", 30, 60, 45, help="Thermal efficiency of the reactor system")
+            run_time = st.slider("Operational Years", 1, 40, 20, help="Expected operational lifetime")
+            capacity_factor = st.slider("Capacity Factor (%)", 70, 95, 85, help="Percentage of time reactor operates at full power")
+            
+            # Additional parameters
+            st.markdown("### 🔧 Advanced Settings")
+            cooling_system = st.selectbox("Cooling System", ["Liquid Sodium", "Molten Salt", "Helium Gas"], index=1)
+            reactor_type = st.selectbox("Reactor Type", ["Fast Breeder", "Molten Salt", "Heavy Water"], index=1)
+            st.form_submit_button("⚛️ Run Simulation", type="primary")
+        
+        # Calculate outputs (scalar call of the vectorized formulas in reactor_physics)
+        outputs = compute_reactor_outputs(fuel_input, efficiency, capacity_factor, run_time)
+        yearly_output = outputs["yearly_output"]
+        total_output = outputs["total_output"]
+        co2_saved = outputs["co2_saved"]
         
         # Prepare simulation data for saving
         simulation_parameters = {
@@ -535,8 +588,8 @@ def reactor_simulator(user_id=None):
             "yearly_output": yearly_output,
             "total_output": total_output,
             "co2_saved": co2_saved,
-            "fuel_utilization": (efficiency * capacity_factor / 10000.0),
-            "cost_per_mwh": 45 + (100-fuel_input)*0.5
+            "fuel_utilization": outputs["fuel_utilization"],
+            "cost_per_mwh": outputs["cost_per_mwh"]
         }
         
         # Display key metrics
@@ -555,73 +608,7 @@ def reactor_simulator(user_id=None):
     with col2:
         st.markdown("### 📈 Performance Analytics")
         
-        # Create interactive Plotly charts (correctly indented)
-        years = np.arange(1, run_time + 1)
-        cumulative_output = np.cumsum([yearly_output] * run_time)
-        
-        # Create subplots
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('Yearly Energy Output', 'Cumulative Energy Output', 'Efficiency Trends', 'Cost Analysis'),
-            specs=[[{"secondary_y": False}, {"secondary_y": False}],
-                   [{"secondary_y": False}, {"secondary_y": False}]]
-        )
-        
-        # Yearly output chart
-        fig.add_trace(
-            go.Scatter(x=years, y=[yearly_output] * run_time, 
-                      mode='lines+markers', name='Yearly Output',
-                      line=dict(color='#1f77b4', width=3),
-                      marker=dict(size=8)),
-            row=1, col=1
-        )
-        
-        # Cumulative output chart
-        fig.add_trace(
-            go.Scatter(x=years, y=cumulative_output,
-                      mode='lines+markers', name='Cumulative Output',
-                      line=dict(color='#ff7f0e', width=3),
-                      marker=dict(size=8)),
-            row=1, col=2
-        )
-        
-        # Efficiency trends (simulated)
-        efficiency_trend = [efficiency + float(np.random.normal(0, 2)) for _ in years]
-        fig.add_trace(
-            go.Scatter(x=years, y=efficiency_trend,
-                      mode='lines+markers', name='Efficiency',
-                      line=dict(color='#2ca02c', width=3),
-                      marker=dict(size=8)),
-            row=2, col=1
-        )
-        
-        # Cost analysis
-        cost_per_mwh = [simulation_results['cost_per_mwh'] + float(np.random.normal(0, 1)) for _ in years]
-        fig.add_trace(
-            go.Scatter(x=years, y=cost_per_mwh,
-                      mode='lines+markers', name='Cost/MWh',
-                      line=dict(color='#d62728', width=3),
-                      marker=dict(size=8)),
-            row=2, col=2
-        )
-        
-        # Update layout
-        fig.update_layout(
-            height=600,
-            showlegend=False,
-            title_text="Thorium Reactor Performance Dashboard",
-            title_x=0.5,
-            font=dict(family="Inter", size=12)
-        )
-        
-        # Update x and y axis labels
-        fig.update_xaxes(title_text="Years", row=2, col=1)
-        fig.update_xaxes(title_text="Years", row=2, col=2)
-        fig.update_yaxes(title_text="Efficiency (%)", row=2, col=1)
-        fig.update_yaxes(title_text="Cost (₹/MWh)", row=2, col=2)
-        fig.update_yaxes(title_text="Energy (GWh)", row=1, col=1)
-        fig.update_yaxes(title_text="Energy (GWh)", row=1, col=2)
-        
+        fig = build_reactor_dashboard(fuel_input, efficiency, capacity_factor, run_time)
         st.plotly_chart(fig, use_container_width=True)
         
         # Additional insights
@@ -659,10 +646,11 @@ def reactor_simulator(user_id=None):
         with save_col:
             if st.button("💾 Save Reactor Simulation", help="Save your reactor simulation parameters and results"):
                 if user_id:
+                    # Saved on the script thread: the success message is only shown once the row is written
                     try:
-                        auth_manager.save_simulation(user_id, "reactor", simulation_parameters, simulation_results)
+                        save_simulation(user_id, "reactor", simulation_parameters, simulation_results)
                         st.success("Reactor simulation saved successfully!")
-                        db_manager.log_analytics(user_id, "simulation_saved", "reactor", st.session_state.get('session_id', 'unknown'), simulation_parameters)
+                        log_event(user_id, "simulation_saved", "reactor", simulation_parameters)
                     except Exception:
                         st.error("Save failed (placeholder).")
                 else:
@@ -671,7 +659,7 @@ def reactor_simulator(user_id=None):
         with export_col:
             if st.button("📊 Export Simulation Results", help="Export your simulation data as PDF, Excel, or JSON"):
                 if user_id:
-                    export_data = prepare_simulation_data("reactor", simulation_parameters, simulation_results)
+                    export_data = prepare_export_payload("reactor", simulation_parameters, simulation_results)
                     show_export_options(user_id, export_data, "reactor")
                 else:
                     st.error("Please login to export data")
@@ -679,6 +667,168 @@ def reactor_simulator(user_id=None):
 # ========================
 # Policy & Impact Simulator Tab
 # ========================
+# Policy model coefficients (slider values are percentages)
+PERCENT = 1 / 100.0
+BASELINE_CO2 = 3500  # MtCO2/year (India's current baseline)
+# Rows: transport, energy, industrial savings. Columns: EV adoption, public transport,
+# thorium share, renewable share, industrial efficiency, carbon capture
+SECTOR_WEIGHTS = np.array([
+    [0.4, 0.3, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.6, 0.4, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 0.0, 0.5, 0.8],
+])
+COST_SAVINGS_PER_THORIUM_PCT = 2.5  # Billion USD per year
+JOBS_PER_CLEAN_ENERGY_PCT = 0.8  # Million jobs
+EMISSIONS_YEARS = np.array([2024, 2025, 2030, 2035])
+EMISSIONS_BAU_MULTIPLIERS = (1.0, 1.05, 1.10, 1.15)
+EMISSIONS_POLICY_MULTIPLIERS = (1.0, 0.98, 0.85)  # 2035 point follows total_savings
+
+# Dashboard labels and styling, shared by every figure build
+ENERGY_MIX_LABELS = ("Thorium", "Renewables", "Fossil Fuels", "Other Nuclear")
+ENERGY_MIX_COLORS = ('#1f77b4', '#2ca02c', '#d62728', '#ff7f0e')
+BAU_LINE_STYLE = dict(color='#d62728', width=3)
+POLICY_LINE_STYLE = dict(color='#2ca02c', width=3)
+BENEFIT_CATEGORIES = ('Energy Savings', 'Job Creation', 'Health Benefits', 'Technology Export')
+BENEFIT_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#9467bd')
+SECTORS = ('Transport', 'Energy', 'Industry', 'Buildings')
+SECTOR_COLORS = ('#17becf', '#bcbd22', '#e377c2', '#8c564b')
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_policy_impact(ev_adoption, public_transport, thorium_share, renewable_share, industrial_efficiency, carbon_capture):
+    """Policy impact results for one set of slider values"""
+    # More sophisticated calculation
+    sector_savings = SECTOR_WEIGHTS @ np.array([ev_adoption, public_transport, thorium_share, renewable_share,
+                                                industrial_efficiency, carbon_capture], dtype=np.float64)
+    transport_savings, energy_savings, industrial_savings = sector_savings.tolist()
+    
+    total_savings = float(sector_savings.mean())
+    co2_reduction = BASELINE_CO2 * total_savings * PERCENT
+    
+    # Economic benefits
+    energy_cost_savings = thorium_share * COST_SAVINGS_PER_THORIUM_PCT
+    job_creation = (thorium_share + renewable_share) * JOBS_PER_CLEAN_ENERGY_PCT
+    
+    return {
+        "co2_reduction": co2_reduction,
+        "energy_cost_savings": energy_cost_savings,
+        "job_creation": job_creation,
+        "total_savings": total_savings,
+        "transport_savings": transport_savings,
+        "energy_savings": energy_savings,
+        "industrial_savings": industrial_savings
+    }
+
+@st.cache_resource
+def policy_dashboard_template():
+    """Subplot grid, titles and axis labels for the policy dashboard; built once per process"""
+    from plotly.subplots import make_subplots  # plotly loads on the first simulator render, not at startup
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Energy Mix 2035', 'CO₂ Emissions Trend', 'Economic Benefits', 'Sectoral Impact'),
+        specs=[[{"type": "pie"}, {"type": "scatter"}],
+               [{"type": "bar"}, {"type": "bar"}]]
+    )
+    
+    # Update layout
+    fig.update_layout(
+        height=700,
+        showlegend=True,
+        title_text="India's Clean Energy Transition Dashboard",
+        title_x=0.5,
+        font=dict(family="Inter", size=12)
+    )
+    
+    # Update axis labels
+    fig.update_xaxes(title_text="Year", row=1, col=2)
+    fig.update_yaxes(title_text="CO₂ Emissions (MtCO₂)", row=1, col=2)
+    fig.update_yaxes(title_text="Economic Value (Billion USD)", row=2, col=1)
+    fig.update_yaxes(title_text="Impact Score", row=2, col=2)
+    
+    return fig
+
+@st.cache_resource(max_entries=32)
+def build_policy_dashboard(ev_adoption, public_transport, thorium_share, renewable_share, industrial_efficiency, carbon_capture):
+    """Build the policy impact dashboard; cached on the slider values so reruns reuse the figure"""
+    results = compute_policy_impact(ev_adoption, public_transport, thorium_share, renewable_share,
+                                    industrial_efficiency, carbon_capture)
+    baseline_co2 = BASELINE_CO2
+    total_savings = results["total_savings"]
+    energy_cost_savings = results["energy_cost_savings"]
+    job_creation = results["job_creation"]
+    transport_savings = results["transport_savings"]
+    energy_savings = results["energy_savings"]
+    industrial_savings = results["industrial_savings"]
+    
+    import plotly.graph_objects as go
+    
+    # Start from the shared layout; only the traces depend on the sliders
+    fig = copy.deepcopy(policy_dashboard_template())
+    
+    # Energy mix pie chart
+    energy_values = [thorium_share, renewable_share, 
+                    max(0, 100 - thorium_share - renewable_share - 10), 10]
+    
+    fig.add_trace(
+        go.Pie(labels=ENERGY_MIX_LABELS, values=energy_values, 
+              marker_colors=ENERGY_MIX_COLORS, textinfo='label+percent'),
+        row=1, col=1
+    )
+    
+    # CO₂ emissions trend: both scenarios in one broadcast over the baseline
+    emission_multipliers = np.array([EMISSIONS_BAU_MULTIPLIERS,
+                                     EMISSIONS_POLICY_MULTIPLIERS + (1 - total_savings * PERCENT,)])
+    current_emissions, projected_emissions = baseline_co2 * emission_multipliers
+    
+    fig.add_trace(
+        go.Scattergl(x=EMISSIONS_YEARS, y=current_emissions, mode='lines+markers', 
+                  name='Business as Usual', line=BAU_LINE_STYLE),
+        row=1, col=2
+    )
+    
+    fig.add_trace(
+        go.Scattergl(x=EMISSIONS_YEARS, y=projected_emissions, mode='lines+markers', 
+                  name='With Thorium Policy', line=POLICY_LINE_STYLE),
+        row=1, col=2
+    )
+    
+    # Economic benefits
+    benefit_values = [energy_cost_savings, job_creation * 2, thorium_share * 1.5, renewable_share * 0.8]
+    
+    fig.add_trace(
+        go.Bar(x=BENEFIT_CATEGORIES, y=benefit_values, 
+              marker_color=BENEFIT_COLORS),
+        row=2, col=1
+    )
+    
+    # Sectoral impact
+    sector_impact = [transport_savings, energy_savings, industrial_savings, (transport_savings + energy_savings) / 2]
+    
+    fig.add_trace(
+        go.Bar(x=SECTORS, y=sector_impact, 
+              marker_color=SECTOR_COLORS),
+        row=2, col=2
+    )
+    
+    return fig
+
+POLICY_TIMELINE = {
+    "Phase": ["2024-2026", "2026-2030", "2030-2035"],
+    "Focus": ["Foundation", "Scale-up", "Optimization"],
+    "Key Actions": [
+        "Establish thorium research facilities, EV charging infrastructure",
+        "Deploy thorium reactors, expand renewable capacity",
+        "Achieve energy independence, export clean tech"
+    ]
+}
+
+@st.cache_resource
+def policy_timeline_frame():
+    """The timeline never changes, so the DataFrame is built once per process (read-only, hence no copy)"""
+    import pandas as pd
+    return pd.DataFrame(POLICY_TIMELINE)
+
+# Fragment: its own widgets rerun only this tab, not the whole app and every other figure
+@st.fragment
 def policy_simulator(user_id=None):
     st.markdown('<div class="main-header"><h1>🌍 Policy & Impact Simulator</h1><p>Analyze the environmental and economic impact of thorium energy adoption in India</p></div>', unsafe_allow_html=True)
     
@@ -686,35 +836,35 @@ def policy_simulator(user_id=None):
     col1, col2 = st.columns([1, 2])
     
     with col1:
-        st.markdown("### 🎛️ Policy Parameters")
-        
-        # Policy sliders with better organization
-        st.markdown("#### 🚗 Transportation Sector")
-        ev_adoption = st.slider("EV Adoption by 2035 (%)", 0, 100, 50, help="Percentage of vehicles that will be electric by 2035")
-        public_transport = st.slider("Public Transport Enhancement (%)", 0, 100, 30, help="Improvement in public transportation infrastructure")
-        
-        st.markdown("#### ⚡ Energy Sector")
-        thorium_share = st.slider("Thorium Share in Energy Mix (%)", 0, 100, 30, help="Percentage of energy from thorium-based nuclear")
-        renewable_share = st.slider("Renewable Energy Share (%)", 0, 100, 25, help="Percentage from solar, wind, hydro")
-        
-        st.markdown("#### 🏭 Industrial Sector")
-        industrial_efficiency = st.slider("Industrial Efficiency Gains (%)", 0, 50, 20, help="Energy efficiency improvements in industry")
-        carbon_capture = st.slider("Carbon Capture Technology (%)", 0, 30, 10, help="Percentage of emissions captured")
+        # Form: dragging a slider no longer reruns the tab; values apply together on submit
+        with st.form("policy_params"):
+            st.markdown("### 🎛️ Policy Parameters")
+            
+            # Policy sliders with better organization
+            st.markdown("#### 🚗 Transportation Sector")
+            ev_adoption = st.slider("EV Adoption by 2035 (%)", 0, 100, 50, help="Percentage of vehicles that will be electric by 2035")
+            public_transport = st.slider("Public Transport Enhancement (%)", 0, 100, 30, help="Improvement in public transportation infrastructure")
+            
+            st.markdown("#### ⚡ Energy Sector")
+            thorium_share = st.slider("Thorium Share in Energy Mix (%)", 0, 100, 30, help="Percentage of energy from thorium-based nuclear")
+            renewable_share = st.slider("Renewable Energy Share (%)", 0, 100, 25, help="Percentage from solar, wind, hydro")
+            
+            st.markdown("#### 🏭 Industrial Sector")
+            industrial_efficiency = st.slider("Industrial Efficiency Gains (%)", 0, 50, 20, help="Energy efficiency improvements in industry")
+            carbon_capture = st.slider("Carbon Capture Technology (%)", 0, 30, 10, help="Percentage of emissions captured")
+            st.form_submit_button("🌍 Run Policy Analysis", type="primary")
         
         # Calculate comprehensive impact
-        baseline_co2 = 3500  # MtCO2/year (India's current baseline)
-        
-        # More sophisticated calculation
-        transport_savings = ev_adoption * 0.4 + public_transport * 0.3
-        energy_savings = thorium_share * 0.6 + renewable_share * 0.4
-        industrial_savings = industrial_efficiency * 0.5 + carbon_capture * 0.8
-        
-        total_savings = (transport_savings + energy_savings + industrial_savings) / 3
-        co2_reduction = baseline_co2 * (total_savings / 100)
-        
-        # Economic benefits
-        energy_cost_savings = thorium_share * 2.5  # Billion USD per year
-        job_creation = (thorium_share + renewable_share) * 0.8  # Million jobs
+        baseline_co2 = BASELINE_CO2
+        policy_results = compute_policy_impact(ev_adoption, public_transport, thorium_share, renewable_share,
+                                               industrial_efficiency, carbon_capture)
+        transport_savings = policy_results["transport_savings"]
+        energy_savings = policy_results["energy_savings"]
+        industrial_savings = policy_results["industrial_savings"]
+        total_savings = policy_results["total_savings"]
+        co2_reduction = policy_results["co2_reduction"]
+        energy_cost_savings = policy_results["energy_cost_savings"]
+        job_creation = policy_results["job_creation"]
         
         # Prepare simulation data for saving
         policy_parameters = {
@@ -726,16 +876,6 @@ def policy_simulator(user_id=None):
             "carbon_capture": carbon_capture
         }
         
-        policy_results = {
-            "co2_reduction": co2_reduction,
-            "energy_cost_savings": energy_cost_savings,
-            "job_creation": job_creation,
-            "total_savings": total_savings,
-            "transport_savings": transport_savings,
-            "energy_savings": energy_savings,
-            "industrial_savings": industrial_savings
-        }
-        
         # Display key metrics
         st.markdown("### 📊 Impact Metrics")
         
@@ -761,78 +901,8 @@ def policy_simulator(user_id=None):
     with col2:
         st.markdown("### 📈 Impact Visualization")
         
-        # Create comprehensive dashboard
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('Energy Mix 2035', 'CO₂ Emissions Trend', 'Economic Benefits', 'Sectoral Impact'),
-            specs=[[{"type": "pie"}, {"type": "scatter"}],
-                   [{"type": "bar"}, {"type": "bar"}]]
-        )
-        
-        # Energy mix pie chart
-        energy_labels = ["Thorium", "Renewables", "Fossil Fuels", "Other Nuclear"]
-        energy_values = [thorium_share, renewable_share, 
-                        max(0, 100 - thorium_share - renewable_share - 10), 10]
-        colors = ['#1f77b4', '#2ca02c', '#d62728', '#ff7f0e']
-        
-        fig.add_trace(
-            go.Pie(labels=energy_labels, values=energy_values, 
-                  marker_colors=colors, textinfo='label+percent'),
-            row=1, col=1
-        )
-        
-        # CO₂ emissions trend
-        years_plot = [2024, 2025, 2030, 2035]
-        current_emissions = [baseline_co2, baseline_co2 * 1.05, baseline_co2 * 1.1, baseline_co2 * 1.15]
-        projected_emissions = [baseline_co2, baseline_co2 * 0.98, baseline_co2 * 0.85, baseline_co2 * (1 - total_savings/100)]
-        
-        fig.add_trace(
-            go.Scatter(x=years_plot, y=current_emissions, mode='lines+markers', 
-                      name='Business as Usual', line=dict(color='#d62728', width=3)),
-            row=1, col=2
-        )
-        
-        fig.add_trace(
-            go.Scatter(x=years_plot, y=projected_emissions, mode='lines+markers', 
-                      name='With Thorium Policy', line=dict(color='#2ca02c', width=3)),
-            row=1, col=2
-        )
-        
-        # Economic benefits
-        benefit_categories = ['Energy Savings', 'Job Creation', 'Health Benefits', 'Technology Export']
-        benefit_values = [energy_cost_savings, job_creation * 2, thorium_share * 1.5, renewable_share * 0.8]
-        
-        fig.add_trace(
-            go.Bar(x=benefit_categories, y=benefit_values, 
-                  marker_color=['#1f77b4', '#ff7f0e', '#2ca02c', '#9467bd']),
-            row=2, col=1
-        )
-        
-        # Sectoral impact
-        sectors = ['Transport', 'Energy', 'Industry', 'Buildings']
-        sector_impact = [transport_savings, energy_savings, industrial_savings, (transport_savings + energy_savings) / 2]
-        
-        fig.add_trace(
-            go.Bar(x=sectors, y=sector_impact, 
-                  marker_color=['#17becf', '#bcbd22', '#e377c2', '#8c564b']),
-            row=2, col=2
-        )
-        
-        # Update layout
-        fig.update_layout(
-            height=700,
-            showlegend=True,
-            title_text="India's Clean Energy Transition Dashboard",
-            title_x=0.5,
-            font=dict(family="Inter", size=12)
-        )
-        
-        # Update axis labels
-        fig.update_xaxes(title_text="Year", row=1, col=2)
-        fig.update_yaxes(title_text="CO₂ Emissions (MtCO₂)", row=1, col=2)
-        fig.update_yaxes(title_text="Economic Value (Billion USD)", row=2, col=1)
-        fig.update_yaxes(title_text="Impact Score", row=2, col=2)
-        
+        fig = build_policy_dashboard(ev_adoption, public_transport, thorium_share, renewable_share,
+                                     industrial_efficiency, carbon_capture)
         st.plotly_chart(fig, use_container_width=True)
         
         # Additional insights
@@ -857,18 +927,7 @@ def policy_simulator(user_id=None):
         # Policy timeline
         st.markdown("### 📅 Recommended Policy Timeline")
         
-        timeline_data = {
-            "Phase": ["2024-2026", "2026-2030", "2030-2035"],
-            "Focus": ["Foundation", "Scale-up", "Optimization"],
-            "Key Actions": [
-                "Establish thorium research facilities, EV charging infrastructure",
-                "Deploy thorium reactors, expand renewable capacity",
-                "Achieve energy independence, export clean tech"
-            ]
-        }
-        
-        timeline_df = pd.DataFrame(timeline_data)
-        st.dataframe(timeline_df, use_container_width=True, hide_index=True)
+        st.dataframe(policy_timeline_frame(), use_container_width=True, hide_index=True)
         
         # Save simulation and export options
         st.markdown("---")
@@ -878,10 +937,11 @@ def policy_simulator(user_id=None):
         with c1:
             if st.button("💾 Save Policy Analysis", help="Save your policy simulation parameters and results"):
                 if user_id:
+                    # Saved on the script thread: the success message is only shown once the row is written
                     try:
-                        auth_manager.save_simulation(user_id, "policy", policy_parameters, policy_results)
+                        save_simulation(user_id, "policy", policy_parameters, policy_results)
                         st.success("Policy analysis saved successfully!")
-                        db_manager.log_analytics(user_id, "simulation_saved", "policy", st.session_state.get('session_id', 'unknown'), policy_parameters)
+                        log_event(user_id, "simulation_saved", "policy", policy_parameters)
                     except Exception:
                         st.error("Save failed (placeholder).")
                 else:
@@ -890,7 +950,7 @@ def policy_simulator(user_id=None):
         with c2:
             if st.button("📊 Export Policy Analysis", help="Export your policy analysis data as PDF, Excel, or JSON"):
                 if user_id:
-                    export_data = prepare_simulation_data("policy", policy_parameters, policy_results)
+                    export_data = prepare_export_payload("policy", policy_parameters, policy_results)
                     show_export_options(user_id, export_data, "policy")
                 else:
                     st.error("Please login to export data")
@@ -904,30 +964,84 @@ optimize_for_mobile()
 
 # Check authentication - if not authenticated, show login page and stop
 if not check_auth():
+    add_deferred_mobile_css()
     st.stop()  # This will stop the app execution and only show the login page
 
 # Get current user (only reached if authentication is successful)
 current_user = get_current_user()
 user_id = current_user.get('id') if isinstance(current_user, dict) else None
 
-# Sidebar with user info and features
-with st.sidebar:
-    st.markdown("""
+# Static and per-user HTML; a session-once guard is not an option because Streamlit
+# drops any element that is not emitted again, so these are merged into fewer elements instead
+SIDEBAR_BRANDING_HTML = """
     <div style="text-align: center; padding: 1rem;">
         <h2 style="color: white; margin: 0;">⚡ Thorium GenAI</h2>
         <p style="color: white; opacity: 0.8; margin: 0.5rem 0;">India's Clean Energy Future</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+USER_CARD_TMPL = """
+        <div style="background: rgba(255,255,255,0.1); padding: 1rem; border-radius: 8px; margin: 1rem 0;">
+            <p style="color: white; margin: 0;"><strong>👤 {username}</strong></p>
+            <p style="color: white; opacity: 0.8; margin: 0; font-size: 0.9rem;">Role: {role}</p>
+        </div>
+        """
+WELCOME_HEADER_TMPL = """
+<div class="main-header">
+    <h1>⚡ Thorium GenAI Dashboard</h1>
+    <p>Welcome back, {username}! Explore India's Clean Energy Future through Advanced Thorium Technology</p>
+</div>
+"""
+DASHBOARD_INTRO_HTML = """
+<div style="background: white; padding: 2rem; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 2rem;">
+    <h3 style="color: #1f77b4; margin-top: 0;">🌱 Welcome to India's Thorium Energy Revolution</h3>
+    <p style="font-size: 1.1rem; line-height: 1.6; color: #2c3e50;">
+        India holds one of the world's largest thorium reserves, positioning us to become a global leader in clean, 
+        safe, and abundant nuclear energy. This interactive platform helps you explore the potential of thorium-based 
+        nuclear reactors for India's energy security and climate goals.
+    </p>
+    <div style="display: flex; gap: 2rem; margin-top: 1.5rem;">
+        <div style="text-align: center;">
+            <div style="font-size: 2rem; font-weight: bold; color: #1f77b4;">360,000</div>
+            <div style="font-size: 0.9rem; color: #6c757d;">Tons of Thorium Reserves</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 2rem; font-weight: bold; color: #2ca02c;">70%</div>
+            <div style="font-size: 0.9rem; color: #6c757d;">Less Nuclear Waste</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 2rem; font-weight: bold; color: #ff7f0e;">2035</div>
+            <div style="font-size: 0.9rem; color: #6c757d;">Target Deployment</div>
+        </div>
+    </div>
+</div>
+"""
+
+def join_html(*parts):
+    # No blank lines between the parts, so markdown keeps them one HTML block (indented lines would become code)
+    return "\n".join(part.strip() for part in parts)
+
+def get_user_banners(user):
+    """Per-user HTML, formatted once per login and kept in the session (keyed on the session token)"""
+    token = user.get('session_token')
+    banners = st.session_state.get("user_banners")
+    if not banners or banners["token"] != token:
+        banners = {
+            "token": token,
+            "sidebar_header": join_html(SIDEBAR_BRANDING_HTML, USER_CARD_TMPL.format(username=user.get('username', 'User'), role=user.get('role', 'guest'))),
+            "welcome_header": join_html(WELCOME_HEADER_TMPL.format(username=user.get('username', 'User')), DASHBOARD_INTRO_HTML)
+        }
+        st.session_state["user_banners"] = banners
+    return banners
+
+user_banners = get_user_banners(current_user)
+
+# Sidebar with user info and features
+with st.sidebar:
+    # Branding and user card go out as one element
+    st.markdown(user_banners["sidebar_header"], unsafe_allow_html=True)
     
     # User info
     if current_user:
-        st.markdown(f"""
-        <div style="background: rgba(255,255,255,0.1); padding: 1rem; border-radius: 8px; margin: 1rem 0;">
-            <p style="color: white; margin: 0;"><strong>👤 {current_user.get('username','User')}</strong></p>
-            <p style="color: white; opacity: 0.8; margin: 0; font-size: 0.9rem;">Role: {current_user.get('role','guest')}</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
         # User stats display if available
         try:
             from database import get_user_stats_display
@@ -963,11 +1077,21 @@ with st.sidebar:
     theme = st.selectbox("Theme", ["Default", "Dark Mode", "High Contrast"], index=0)
     language = st.selectbox("Language", ["English", "Hindi", "Tamil", "Telugu"], index=0)
     if st.button("💾 Save Preferences"):
-        try:
-            db_manager.save_user_preference(user_id, "app_preferences", {"theme": theme, "language": language})
-            st.success("Preferences saved!")
-        except Exception:
-            st.info("Preferences saved (demo)")
+        # Written on the persistence pool; the outcome is reported from the future once it has finished
+        st.session_state.preferences_save = get_persist_pool().submit(
+            db_manager.save_user_preference, user_id, "app_preferences", {"theme": theme, "language": language}
+        )
+    
+    pending_save = st.session_state.get('preferences_save')
+    if pending_save is not None:
+        if not pending_save.done():
+            st.caption("Saving preferences…")
+        else:
+            del st.session_state.preferences_save
+            if pending_save.exception() is None:
+                st.toast("Preferences saved!")
+            else:
+                st.toast("Could not save preferences.")
     
     st.markdown("---")
     st.markdown("### ⚡ Quick Actions")
@@ -975,22 +1099,21 @@ with st.sidebar:
         st.session_state.show_analytics = True
 
     if st.button("📈 View Export History"):
-        exports = db_manager.get_export_history(user_id)
+        exports = cached_export_history(user_id)
         if exports:
             st.write("Recent exports:")
-            for export in exports[:5]:
-                st.write(f"• {export[0]} - {export[1]} ({export[2][:10]})")
+            # One table element instead of a write per row
+            st.table([{"Type": export[0], "File": export[1], "Date": export[2][:10]} for export in exports[:5]])
         else:
             st.info("No exports yet")
 
     if st.button("🧠 View Simulation History"):
         try:
-            simulations = auth_manager.get_user_simulations(user_id)
+            simulations = cached_user_simulations(user_id)
         except Exception:
             simulations = []
         if simulations:
-            for sim in simulations[:5]:
-                st.write(f"• {sim[0]} ({sim[3][:10]})")
+            st.table([{"Simulation": sim[0], "Date": sim[3][:10]} for sim in simulations[:5]])
         else:
             st.info("No simulations yet")
     
@@ -1003,39 +1126,8 @@ with st.sidebar:
     """)
     show_logout_button()
 
-# Main content - Welcome Dashboard
-st.markdown("""
-<div class="main-header">
-    <h1>⚡ Thorium GenAI Dashboard</h1>
-    <p>Welcome back, {username}! Explore India's Clean Energy Future through Advanced Thorium Technology</p>
-</div>
-""".format(username=current_user.get('username', 'User')), unsafe_allow_html=True)
-
-# Intro block
-st.markdown("""
-<div style="background: white; padding: 2rem; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 2rem;">
-    <h3 style="color: #1f77b4; margin-top: 0;">🌱 Welcome to India's Thorium Energy Revolution</h3>
-    <p style="font-size: 1.1rem; line-height: 1.6; color: #2c3e50;">
-        India holds one of the world's largest thorium reserves, positioning us to become a global leader in clean, 
-        safe, and abundant nuclear energy. This interactive platform helps you explore the potential of thorium-based 
-        nuclear reactors for India's energy security and climate goals.
-    </p>
-    <div style="display: flex; gap: 2rem; margin-top: 1.5rem;">
-        <div style="text-align: center;">
-            <div style="font-size: 2rem; font-weight: bold; color: #1f77b4;">360,000</div>
-            <div style="font-size: 0.9rem; color: #6c757d;">Tons of Thorium Reserves</div>
-        </div>
-        <div style="text-align: center;">
-            <div style="font-size: 2rem; font-weight: bold; color: #2ca02c;">70%</div>
-            <div style="font-size: 0.9rem; color: #6c757d;">Less Nuclear Waste</div>
-        </div>
-        <div style="text-align: center;">
-            <div style="font-size: 2rem; font-weight: bold; color: #ff7f0e;">2035</div>
-            <div style="font-size: 0.9rem; color: #6c757d;">Target Deployment</div>
-        </div>
-    </div>
-</div>
-""", unsafe_allow_html=True)
+# Main content - Welcome Dashboard (header and intro block in one element)
+st.markdown(user_banners["welcome_header"], unsafe_allow_html=True)
 
 # Mobile navigation (stub safe)
 show_mobile_navigation()
@@ -1077,29 +1169,31 @@ with tab4:
 if st.session_state.get('show_analytics', False):
     st.markdown("---")
     st.markdown("### 📊 User Analytics")
-    try:
-        db_manager.log_analytics(user_id, "analytics_view", "main_page", st.session_state.get('session_id', 'unknown'))
-    except Exception:
-        pass
+    log_event(user_id, "analytics_view", "main_page")
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("#### 📈 Usage Statistics")
-        stats = db_manager.get_user_stats(user_id)
+        stats = cached_user_stats(user_id)
         
-        # Create usage chart
+        # Create usage chart (native Vega-Lite bar chart; no Plotly figure for three bars)
+        import pandas as pd
         usage_data = {
             'Simulations': stats.get('simulation_count', 0),
             'Exports': stats.get('export_count', 0),
             'Days Active': 7  # placeholder
         }
         
-        fig = px.bar(x=list(usage_data.keys()), y=list(usage_data.values()),
-                    title="Your Activity Summary",
-                    color=list(usage_data.keys()),
-                    color_discrete_sequence=px.colors.qualitative.Set3)
-        st.plotly_chart(fig, use_container_width=True)
+        st.caption("Your Activity Summary")
+        st.bar_chart(pd.Series(usage_data, name="Count"), use_container_width=True)
+        
+        reactor_summary = cached_reactor_summary(user_id)
+        if reactor_summary['runs']:
+            runs_col, avg_col = st.columns(2)
+            runs_col.metric("Saved Reactor Runs", reactor_summary['runs'])
+            if reactor_summary['average'] is not None:
+                avg_col.metric("Avg Yearly Output", f"{reactor_summary['average']:,.0f}")
     
     with col2:
         st.markdown("#### 🎯 Recommendations")
@@ -1126,3 +1220,5 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# Non-critical responsive CSS goes last so it does not hold up the content above
+add_deferred_mobile_css()
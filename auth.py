@@ -1,11 +1,16 @@
 # auth.py - Authentication and User Management System
 import streamlit as st
 import sqlite3
+import threading
 import hashlib
+import hmac
 import secrets
+import json
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import JWT, fallback to simple token if not available
 try:
@@ -15,18 +20,96 @@ except ImportError:
     JWT_AVAILABLE = False
     print("JWT not available, using simple token authentication")
 
+# Try to import argon2, fallback to PBKDF2 (standard library) if not available
+try:
+    from argon2 import PasswordHasher
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+    print("argon2 not available, using PBKDF2 password hashing")
+
+PBKDF2_ITERATIONS = 600000
+SESSION_HOURS = 24
+VERIFIED_SESSION_CACHE_SIZE = 4096
+SESSION_RECHECK_SECONDS = 300
+SWEEP_INTERVAL_SECONDS = 3600
+
+# Login and session checks run on every sign-in/request; keeping their SQL as shared constants
+# means each per-thread connection prepares them once and then hits its statement cache
+SQL_FIND_USER = '''
+    SELECT id, username, email, password_hash, role FROM users 
+    WHERE username = ? OR email = ?
+'''
+SQL_CREATE_SESSION = '''
+    INSERT INTO user_sessions (user_id, session_token, expires_at)
+    VALUES (?, ?, ?)
+'''
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+SQL_CREATE_RANDOM_SESSION = '''
+    INSERT INTO user_sessions (user_id, session_token, expires_at)
+    VALUES (?, lower(hex(randomblob(24))), ?)
+    RETURNING session_token
+'''
+SQL_VERIFY_SESSION = '''
+    SELECT u.id, u.username, u.email, u.role, s.expires_at
+    FROM users u
+    JOIN user_sessions s ON u.id = s.user_id
+    WHERE s.session_token = ? AND s.expires_at > CURRENT_TIMESTAMP
+'''
+
+# Simulation parameters/results as stored in simulation_history
+def _encode_payload(obj):
+    """Compact, round-trippable JSON for stored parameters/results (numpy scalars fall back to str)"""
+    return json.dumps(obj, separators=(',', ':'), default=str)
+
+def _decode_payload(text):
+    """Inverse of _encode_payload; rows written before it are str(dict) and come back as stored"""
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        return text
+
 class AuthManager:
     def __init__(self, db_path="thorium_app.db"):
         self.db_path = db_path
+        self._local = threading.local()
         self.secret_key = os.getenv("SECRET_KEY", "thorium-secret-key-2024")
+        self.password_hasher = PasswordHasher() if ARGON2_AVAILABLE else None
+        # token -> (expires_at epoch, user info); LRU-bounded, dropped on logout
+        self._verified_sessions = OrderedDict()
+        self._verified_sessions_lock = threading.Lock()
         self.init_database()
+        
+        # Expired sessions and cache rows are purged now and then hourly by a daemon thread
+        threading.Thread(target=self._sweep_loop, name="thorium-sweeper", daemon=True).start()
+    
+    def _conn(self):
+        """Per-thread connection, opened on first use and reused by every later call on that thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row  # columns by name; rows handed to callers are copied into dicts/tuples
+            # Per-connection settings (journal_mode is set once in init_database)
+            conn.executescript('''
+                PRAGMA synchronous=NORMAL;
+                PRAGMA cache_size=-20000;
+                PRAGMA mmap_size=268435456;
+                PRAGMA temp_store=MEMORY;
+            ''')
+            self._local.conn = conn
+        return conn
     
     def init_database(self):
         """Initialize the database with users table"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn()
         
-        cursor.execute('''
+        # One script, one transaction: every statement is IF NOT EXISTS, so reruns are no-ops.
+        # journal_mode has to be set outside the transaction; it sticks to the file (shared with DatabaseManager).
+        conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            
+            BEGIN;
+            
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT UNIQUE NOT NULL,
@@ -36,10 +119,8 @@ class AuthManager:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_login TIMESTAMP,
                 preferences TEXT DEFAULT '{}'
-            )
-        ''')
-        
-        cursor.execute('''
+            );
+            
             CREATE TABLE IF NOT EXISTS user_sessions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id INTEGER,
@@ -47,10 +128,8 @@ class AuthManager:
                 expires_at TIMESTAMP,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        ''')
-        
-        cursor.execute('''
+            );
+            
             CREATE TABLE IF NOT EXISTS simulation_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id INTEGER,
@@ -59,205 +138,286 @@ class AuthManager:
                 results TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (user_id) REFERENCES users (id)
-            )
+            );
+            
+            -- Indexes (username, email and session_token are already indexed by their UNIQUE constraints)
+            CREATE INDEX IF NOT EXISTS idx_sessions_expires ON user_sessions(expires_at);
+            CREATE INDEX IF NOT EXISTS idx_simhist_user_time ON simulation_history(user_id, created_at DESC);
+            
+            -- A new session is a login: stamp last_login in the same statement instead of a second UPDATE
+            CREATE TRIGGER IF NOT EXISTS trg_sessions_last_login AFTER INSERT ON user_sessions
+            BEGIN
+                UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = NEW.user_id;
+            END;
+            
+            COMMIT;
         ''')
+    
+    def sweep_expired(self):
+        """Delete expired sessions and energy cache rows (both store expires_at as local datetime.now())"""
+        conn = self._conn()
+        now = datetime.now()
         
-        conn.commit()
-        conn.close()
+        # The connection context manager commits on success and rolls back on error
+        with conn:
+            conn.execute('DELETE FROM user_sessions WHERE expires_at < ?', (now,))
+            # energy_data_cache belongs to DatabaseManager and may not exist yet on a fresh database
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'energy_data_cache'").fetchone():
+                conn.execute('DELETE FROM energy_data_cache WHERE expires_at < ?', (now,))
+    
+    def _sweep_loop(self):
+        while True:
+            try:
+                self.sweep_expired()
+            except sqlite3.Error:
+                pass
+            time.sleep(SWEEP_INTERVAL_SECONDS)
     
     def hash_password(self, password):
-        """Hash password using SHA-256 with salt"""
+        """Hash password using Argon2id (PBKDF2-SHA256 if argon2 is not installed)"""
+        if self.password_hasher:
+            return self.password_hasher.hash(password)
         salt = secrets.token_hex(16)
-        password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-        return f"{salt}:{password_hash}"
+        password_hash = hashlib.pbkdf2_hmac('sha256', password.encode(), salt.encode(), PBKDF2_ITERATIONS).hex()
+        return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${salt}${password_hash}"
+    
+    def hash_passwords_bulk(self, passwords):
+        """Hash many passwords (admin/batch imports) in parallel; Argon2 and PBKDF2 both release the GIL"""
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            return list(pool.map(self.hash_password, passwords))
     
     def verify_password(self, password, stored_hash):
-        """Verify password against stored hash"""
+        """Verify password against stored hash (Argon2, PBKDF2 or legacy salted SHA-256)"""
         try:
-            salt, hash_value = stored_hash.split(':')
-            password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-            return password_hash == hash_value
+            if stored_hash.startswith('$argon2'):
+                # PasswordHasher.verify raises on a mismatch
+                return self.password_hasher.verify(stored_hash, password)
+            # Compare raw 32-byte digests: the stored hex is decoded once, the fresh digest is never hex-encoded
+            if stored_hash.startswith('pbkdf2_sha256$'):
+                _, iterations, salt, hash_value = stored_hash.split('$')
+                password_hash = hashlib.pbkdf2_hmac('sha256', password.encode(), salt.encode(), int(iterations))
+            else:
+                salt, hash_value = stored_hash.split(':')
+                password_hash = hashlib.sha256((password + salt).encode()).digest()
+            return hmac.compare_digest(password_hash, bytes.fromhex(hash_value))
         except:
             return False
     
+    def needs_rehash(self, stored_hash):
+        """True if the hash predates the current scheme or its parameters"""
+        if self.password_hasher:
+            return not stored_hash.startswith('$argon2') or self.password_hasher.check_needs_rehash(stored_hash)
+        return not stored_hash.startswith(f"pbkdf2_sha256${PBKDF2_ITERATIONS}$")
+    
     def register_user(self, username, email, password, role="user"):
         """Register a new user"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn()
         
         try:
             password_hash = self.hash_password(password)
-            cursor.execute('''
-                INSERT INTO users (username, email, password_hash, role)
-                VALUES (?, ?, ?, ?)
-            ''', (username, email, password_hash, role))
-            
-            conn.commit()
+            with conn:
+                conn.execute('''
+                    INSERT INTO users (username, email, password_hash, role)
+                    VALUES (?, ?, ?, ?)
+                ''', (username, email, password_hash, role))
             return True, "User registered successfully!"
         except sqlite3.IntegrityError:
             return False, "Username or email already exists!"
         except Exception as e:
             return False, f"Registration failed: {str(e)}"
-        finally:
-            conn.close()
     
     def login_user(self, username, password):
         """Login user and create session"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, username, email, password_hash, role FROM users 
-            WHERE username = ? OR email = ?
-        ''', (username, username))
+        conn = self._conn()
         
-        user = cursor.fetchone()
+        user = conn.execute(SQL_FIND_USER, (username, username)).fetchone()
         
-        if user and self.verify_password(password, user[3]):
-            # Create session token
-            session_token = secrets.token_urlsafe(32)
-            expires_at = datetime.now() + timedelta(hours=24)
-            
-            cursor.execute('''
-                INSERT INTO user_sessions (user_id, session_token, expires_at)
-                VALUES (?, ?, ?)
-            ''', (user[0], session_token, expires_at))
-            
-            # Update last login
-            cursor.execute('''
-                UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?
-            ''', (user[0],))
+        if user and self.verify_password(password, user['password_hash']):
+            # Upgrade legacy password hashes now that the plain password is at hand;
+            # hashed before the transaction so the write lock is not held during it
+            new_hash = self.hash_password(password) if self.needs_rehash(user['password_hash']) else None
             
-            conn.commit()
-            conn.close()
+            # Create session token
+            expires_at = datetime.now() + timedelta(hours=SESSION_HOURS)
+            with conn:
+                if JWT_AVAILABLE:
+                    # Signed token: forged or expired tokens are rejected without a database lookup
+                    session_token = jwt.encode({
+                        'uid': user['id'],
+                        'r': user['role'],
+                        'jti': secrets.token_urlsafe(8),  # two logins in the same second still get distinct tokens
+                        'exp': int(expires_at.timestamp())
+                    }, self.secret_key, algorithm='HS256')
+                    conn.execute(SQL_CREATE_SESSION, (user['id'], session_token, expires_at))
+                elif SQLITE_HAS_RETURNING:
+                    # Random token drawn by SQLite and handed back by the INSERT itself
+                    session_token = conn.execute(SQL_CREATE_RANDOM_SESSION, (user['id'], expires_at)).fetchone()['session_token']
+                else:
+                    session_token = secrets.token_urlsafe(32)
+                    conn.execute(SQL_CREATE_SESSION, (user['id'], session_token, expires_at))
+                # users.last_login is updated by the trg_sessions_last_login trigger
+                
+                if new_hash:
+                    conn.execute('''
+                        UPDATE users SET password_hash = ? WHERE id = ?
+                    ''', (new_hash, user['id']))
             
             return True, {
-                'id': user[0],
-                'username': user[1],
-                'email': user[2],
-                'role': user[4],
+                'id': user['id'],
+                'username': user['username'],
+                'email': user['email'],
+                'role': user['role'],
                 'session_token': session_token
             }
         else:
-            conn.close()
             return False, "Invalid username or password!"
     
     def verify_session(self, session_token):
-        """Verify session token and return user info"""
-        conn = sqlite3.connect(self.db_path)
+        """Verify session token and return user info (cached in-process until the session expires)"""
+        now = time.time()
+        with self._verified_sessions_lock:
+            cached = self._verified_sessions.get(session_token)
+            if cached and cached[0] > now:
+                self._verified_sessions.move_to_end(session_token)
+                return True, dict(cached[1])
+            self._verified_sessions.pop(session_token, None)
+        
+        if JWT_AVAILABLE and session_token.count('.') == 2:
+            try:
+                jwt.decode(session_token, self.secret_key, algorithms=['HS256'])
+            except jwt.InvalidTokenError:
+                return False, None
+        
+        # First sight of this token in the process: confirm it has not been revoked
+        conn = self._conn()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT u.id, u.username, u.email, u.role, s.expires_at
-            FROM users u
-            JOIN user_sessions s ON u.id = s.user_id
-            WHERE s.session_token = ? AND s.expires_at > CURRENT_TIMESTAMP
-        ''', (session_token,))
+        cursor.execute(SQL_VERIFY_SESSION, (session_token,))
         
         user = cursor.fetchone()
-        conn.close()
         
         if user:
-            return True, {
-                'id': user[0],
-                'username': user[1],
-                'email': user[2],
-                'role': user[3]
+            user_info = {
+                'id': user['id'],
+                'username': user['username'],
+                'email': user['email'],
+                'role': user['role']
             }
+            try:
+                expires_at = datetime.fromisoformat(str(user['expires_at'])).timestamp()
+            except ValueError:
+                expires_at = now + 300
+            with self._verified_sessions_lock:
+                self._verified_sessions[session_token] = (expires_at, user_info)
+                if len(self._verified_sessions) > VERIFIED_SESSION_CACHE_SIZE:
+                    self._verified_sessions.popitem(last=False)
+            return True, dict(user_info)
         else:
             return False, None
     
     def logout_user(self, session_token):
         """Logout user by removing session"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._verified_sessions_lock:
+            self._verified_sessions.pop(session_token, None)
         
-        cursor.execute('''
-            DELETE FROM user_sessions WHERE session_token = ?
-        ''', (session_token,))
+        conn = self._conn()
         
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute('''
+                DELETE FROM user_sessions WHERE session_token = ?
+            ''', (session_token,))
     
     def save_simulation(self, user_id, simulation_type, parameters, results):
         """Save simulation data for user"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO simulation_history (user_id, simulation_type, parameters, results)
-            VALUES (?, ?, ?, ?)
-        ''', (user_id, simulation_type, str(parameters), str(results)))
+        conn = self._conn()
         
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute('''
+                INSERT INTO simulation_history (user_id, simulation_type, parameters, results)
+                VALUES (?, ?, ?, ?)
+            ''', (user_id, simulation_type, _encode_payload(parameters), _encode_payload(results)))
     
-    def get_user_simulations(self, user_id, limit=10):
-        """Get user's simulation history"""
-        conn = sqlite3.connect(self.db_path)
+    def get_user_simulations(self, user_id, sim_type=None, since=None, limit=10):
+        """Get user's simulation history, optionally filtered by type and start date in SQL"""
+        conn = self._conn()
         cursor = conn.cursor()
         
+        # NULL filters match everything, so one statement text covers every combination
         cursor.execute('''
             SELECT simulation_type, parameters, results, created_at
             FROM simulation_history
-            WHERE user_id = ?
+            WHERE user_id = :uid
+              AND (:sim_type IS NULL OR simulation_type = :sim_type)
+              AND (:since IS NULL OR created_at >= :since)
             ORDER BY created_at DESC
-            LIMIT ?
-        ''', (user_id, limit))
-        
-        simulations = cursor.fetchall()
-        conn.close()
+            LIMIT :limit
+        ''', {'uid': user_id, 'sim_type': sim_type, 'since': since, 'limit': limit})
         
-        return simulations
+        return [(simulation_type, _decode_payload(parameters), _decode_payload(results), created_at)
+                for simulation_type, parameters, results, created_at in cursor.fetchall()]
     
-    def update_user_preferences(self, user_id, preferences):
-        """Update user preferences"""
-        conn = sqlite3.connect(self.db_path)
+    def get_simulation_summary(self, user_id, sim_type, field, since=None):
+        """COUNT and AVG of one numeric results field, aggregated in SQLite via json_extract"""
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute('''
-            UPDATE users SET preferences = ? WHERE id = ?
-        ''', (str(preferences), user_id))
+            SELECT COUNT(*) AS runs, AVG(json_extract(results, :path)) AS average
+            FROM simulation_history
+            WHERE user_id = :uid
+              AND simulation_type = :sim_type
+              AND (:since IS NULL OR created_at >= :since)
+              AND json_valid(results)
+        ''', {'uid': user_id, 'sim_type': sim_type, 'since': since, 'path': f'$.{field}'})
+        
+        row = cursor.fetchone()
+        return {'runs': row['runs'], 'average': row['average']}
+    
+    def update_user_preferences(self, user_id, preferences):
+        """Update user preferences"""
+        conn = self._conn()
         
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute('''
+                UPDATE users SET preferences = ? WHERE id = ?
+            ''', (str(preferences), user_id))
 
 # Initialize auth manager
 auth_manager = AuthManager()
 
-def show_login_page():
-    """Display login/register page"""
-    st.markdown("""
-    <div class="main-header">
-        <h1>🔐 Welcome to Thorium GenAI</h1>
-        <p>Please login or register to access the advanced thorium energy platform</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Add some information about the platform
-    st.markdown("""
-    <div style="background: white; padding: 2rem; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 2rem;">
-        <h3 style="color: #1f77b4; margin-top: 0;">🌱 India's Thorium Energy Revolution</h3>
-        <p style="font-size: 1.1rem; line-height: 1.6; color: #2c3e50;">
-            Access our comprehensive platform featuring AI-powered knowledge assistance, interactive reactor simulations, 
-            policy impact analysis, and real-time energy data to explore thorium-based nuclear energy solutions.
-        </p>
-        <div style="display: flex; gap: 2rem; margin-top: 1.5rem;">
-            <div style="text-align: center;">
-                <div style="font-size: 2rem; font-weight: bold; color: #1f77b4;">360,000</div>
-                <div style="font-size: 0.9rem; color: #6c757d;">Tons of Thorium Reserves</div>
-            </div>
-            <div style="text-align: center;">
-                <div style="font-size: 2rem; font-weight: bold; color: #2ca02c;">70%</div>
-                <div style="font-size: 0.9rem; color: #6c757d;">Less Nuclear Waste</div>
-            </div>
-            <div style="text-align: center;">
-                <div style="font-size: 2rem; font-weight: bold; color: #ff7f0e;">2035</div>
-                <div style="font-size: 0.9rem; color: #6c757d;">Target Deployment</div>
-            </div>
+# Static login page markup, joined without blank lines so markdown keeps it one HTML block
+LOGIN_PAGE_HTML = """
+<div class="main-header">
+    <h1>🔐 Welcome to Thorium GenAI</h1>
+    <p>Please login or register to access the advanced thorium energy platform</p>
+</div>
+<div style="background: white; padding: 2rem; border-radius: 10px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 2rem;">
+    <h3 style="color: #1f77b4; margin-top: 0;">🌱 India's Thorium Energy Revolution</h3>
+    <p style="font-size: 1.1rem; line-height: 1.6; color: #2c3e50;">
+        Access our comprehensive platform featuring AI-powered knowledge assistance, interactive reactor simulations, 
+        policy impact analysis, and real-time energy data to explore thorium-based nuclear energy solutions.
+    </p>
+    <div style="display: flex; gap: 2rem; margin-top: 1.5rem;">
+        <div style="text-align: center;">
+            <div style="font-size: 2rem; font-weight: bold; color: #1f77b4;">360,000</div>
+            <div style="font-size: 0.9rem; color: #6c757d;">Tons of Thorium Reserves</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 2rem; font-weight: bold; color: #2ca02c;">70%</div>
+            <div style="font-size: 0.9rem; color: #6c757d;">Less Nuclear Waste</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 2rem; font-weight: bold; color: #ff7f0e;">2035</div>
+            <div style="font-size: 0.9rem; color: #6c757d;">Target Deployment</div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+</div>
+"""
+
+def show_login_page():
+    """Display login/register page"""
+    # Header and platform card: one static element
+    st.markdown(LOGIN_PAGE_HTML, unsafe_allow_html=True)
     
     tab1, tab2 = st.tabs(["🔑 Login", "📝 Register"])
     
@@ -275,9 +435,10 @@ def show_login_page():
                     if success:
                         st.session_state.authenticated = True
                         st.session_state.user_info = result
-                        st.success("🎉 Login successful! Welcome to Thorium GenAI Dashboard!")
-                        st.balloons()  # Add celebration animation
-                        time.sleep(2)  # Brief pause to show success message
+                        # A toast outlives the rerun, so there is no need to hold the script thread to show it
+                        st.toast("Login successful! Welcome to Thorium GenAI Dashboard!", icon="🎉")
+                        # Balloons sent before st.rerun() never render; the first authenticated run shows them
+                        st.session_state.celebrate_login = True
                         st.rerun()
                     else:
                         st.error(result)
@@ -317,6 +478,21 @@ def check_auth():
         show_login_page()
         return False
     
+    # Every rerun lands here; confirm the session against the store at most every SESSION_RECHECK_SECONDS
+    now = time.monotonic()
+    user_info = st.session_state.get('user_info') or {}
+    if 'session_token' in user_info and now - st.session_state.get('auth_verified_at', 0) > SESSION_RECHECK_SECONDS:
+        valid, _ = auth_manager.verify_session(user_info['session_token'])
+        if not valid:
+            st.session_state.authenticated = False
+            st.session_state.user_info = None
+            show_login_page()
+            return False
+        st.session_state.auth_verified_at = now
+    
+    if st.session_state.pop('celebrate_login', False):
+        st.balloons()
+    
     return True
 
 def show_logout_button():
@@ -326,8 +502,7 @@ def show_logout_button():
             auth_manager.logout_user(st.session_state.user_info['session_token'])
         st.session_state.authenticated = False
         st.session_state.user_info = None
-        st.success("👋 Logged out successfully! Thank you for using Thorium GenAI.")
-        time.sleep(1)
+        st.toast("Logged out successfully! Thank you for using Thorium GenAI.", icon="👋")
         st.rerun()
 
 def get_current_user():
@@ -1,22 +1,71 @@
 # database.py - Database utilities and data management
 import sqlite3
+import threading
+import queue
+import time
 import json
-import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import streamlit as st
 
+# Optional faster JSON for the energy data cache, stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+ANALYTICS_FLUSH_INTERVAL = 0.2  # seconds a batch waits for more events
+ANALYTICS_FLUSH_MAX = 500  # events per INSERT batch
+
+def _dumps_cache(data):
+    """Serialize a cache payload to compact JSON text"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(',', ':'))
+
+def _loads_cache(text):
+    """Parse a cache payload written by _dumps_cache"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
 class DatabaseManager:
     def __init__(self, db_path="thorium_app.db"):
         self.db_path = db_path
+        self._local = threading.local()
         self.init_database()
+        
+        # Analytics writes go through a queue drained by one writer thread
+        self._analytics_queue = queue.Queue()
+        threading.Thread(target=self._flush_analytics_loop, name="thorium-analytics", daemon=True).start()
+    
+    def _conn(self):
+        """Per-thread connection, opened on first use and reused by every later call on that thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            # Per-connection settings; journal_mode=WAL is stored in the file by init_database
+            conn.executescript('''
+                PRAGMA synchronous=NORMAL;
+                PRAGMA cache_size=-20000;
+                PRAGMA mmap_size=268435456;
+                PRAGMA temp_store=MEMORY;
+            ''')
+            self._local.conn = conn
+        return conn
     
     def init_database(self):
         """Initialize all database tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn()
         
-        # User preferences table
-        cursor.execute('''
+        # Single script in one transaction; journal_mode (persistent, set before BEGIN) lets readers
+        # run alongside writers and spares each commit the rollback-journal fsyncs
+        conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            
+            BEGIN;
+            
+            -- User preferences table
             CREATE TABLE IF NOT EXISTS user_preferences (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id INTEGER,
@@ -25,11 +74,9 @@ class DatabaseManager:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        ''')
-        
-        # Energy data cache
-        cursor.execute('''
+            );
+            
+            -- Energy data cache
             CREATE TABLE IF NOT EXISTS energy_data_cache (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 data_type TEXT,
@@ -38,11 +85,9 @@ class DatabaseManager:
                 last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 expires_at TIMESTAMP,
                 UNIQUE(data_type, data_source)
-            )
-        ''')
-        
-        # Export history
-        cursor.execute('''
+            );
+            
+            -- Export history
             CREATE TABLE IF NOT EXISTS export_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id INTEGER,
@@ -52,11 +97,9 @@ class DatabaseManager:
                 export_data TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (user_id) REFERENCES users (id)
-            )
-        ''')
-        
-        # App analytics
-        cursor.execute('''
+            );
+            
+            -- App analytics
             CREATE TABLE IF NOT EXISTS app_analytics (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id INTEGER,
@@ -66,28 +109,30 @@ class DatabaseManager:
                 timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 metadata TEXT,
                 FOREIGN KEY (user_id) REFERENCES users (id)
-            )
+            );
+            
+            -- Per-user lookups, newest first (energy_data_cache is covered by its UNIQUE constraint)
+            CREATE INDEX IF NOT EXISTS idx_prefs_user ON user_preferences(user_id, preference_key);
+            CREATE INDEX IF NOT EXISTS idx_exphist_user_time ON export_history(user_id, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_analytics_user_time ON app_analytics(user_id, timestamp DESC);
+            
+            COMMIT;
         ''')
-        
-        conn.commit()
-        conn.close()
     
     def save_user_preference(self, user_id, key, value):
         """Save user preference"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO user_preferences (user_id, preference_key, preference_value, updated_at)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-        ''', (user_id, key, str(value)))
+        conn = self._conn()
         
-        conn.commit()
-        conn.close()
+        # The connection context manager commits on success and rolls back on error
+        with conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO user_preferences (user_id, preference_key, preference_value, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (user_id, key, str(value)))
     
     def get_user_preferences(self, user_id):
         """Get all user preferences"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -96,29 +141,25 @@ class DatabaseManager:
         ''', (user_id,))
         
         preferences = dict(cursor.fetchall())
-        conn.close()
         
         return preferences
     
     def cache_energy_data(self, data_type, data_source, data_content, ttl_hours=1):
         """Cache energy data with TTL"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn()
         
         expires_at = datetime.now() + timedelta(hours=ttl_hours)
         
-        cursor.execute('''
-            INSERT OR REPLACE INTO energy_data_cache 
-            (data_type, data_source, data_content, last_updated, expires_at)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP, ?)
-        ''', (data_type, data_source, json.dumps(data_content), expires_at))
-        
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO energy_data_cache 
+                (data_type, data_source, data_content, last_updated, expires_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP, ?)
+            ''', (data_type, data_source, _dumps_cache(data_content), expires_at))
     
     def get_cached_energy_data(self, data_type, data_source):
         """Get cached energy data if not expired"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -127,29 +168,26 @@ class DatabaseManager:
         ''', (data_type, data_source))
         
         result = cursor.fetchone()
-        conn.close()
         
         if result:
-            return json.loads(result[0])
+            return _loads_cache(result[0])
         return None
     
     def log_export(self, user_id, export_type, file_name, file_path, export_data):
         """Log export activity"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO export_history 
-            (user_id, export_type, file_name, file_path, export_data)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (user_id, export_type, file_name, file_path, str(export_data)))
+        conn = self._conn()
         
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute('''
+                INSERT INTO export_history 
+                (user_id, export_type, file_name, file_path, export_data)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (user_id, export_type, file_name, file_path, json.dumps(export_data, separators=(',', ':'), default=str)))
+        clear_user_caches()
     
     def get_export_history(self, user_id, limit=10):
         """Get user's export history"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -161,68 +199,97 @@ class DatabaseManager:
         ''', (user_id, limit))
         
         history = cursor.fetchall()
-        conn.close()
         
         return history
     
     def log_analytics(self, user_id, action_type, page_name, session_id, metadata=None):
-        """Log user analytics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO app_analytics 
-            (user_id, action_type, page_name, session_id, metadata)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (user_id, action_type, page_name, session_id, str(metadata) if metadata else None))
+        """Log user analytics (queued; the writer thread inserts it with the next batch)"""
+        self._analytics_queue.put((user_id, action_type, page_name, session_id,
+                                   str(metadata) if metadata else None,
+                                   datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")))
+    
+    def _flush_analytics_loop(self):
+        """Writer thread: block for one event, collect more for up to ANALYTICS_FLUSH_INTERVAL, insert them together"""
+        while True:
+            batch = [self._analytics_queue.get()]
+            deadline = time.monotonic() + ANALYTICS_FLUSH_INTERVAL
+            while len(batch) < ANALYTICS_FLUSH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._analytics_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                self.bulk_log_analytics(batch)
+            except sqlite3.Error:
+                # Analytics are best effort; the batch was rolled back, drop it rather than kill the writer
+                pass
+    
+    def bulk_log_analytics(self, rows):
+        """Insert many (user_id, action_type, page_name, session_id, metadata, timestamp) rows in one transaction"""
+        conn = self._conn()
         
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.executemany('''
+                INSERT INTO app_analytics 
+                (user_id, action_type, page_name, session_id, metadata, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
     
     def get_user_stats(self, user_id):
         """Get user statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
-        # Get simulation count
-        cursor.execute('SELECT COUNT(*) FROM simulation_history WHERE user_id = ?', (user_id,))
-        simulation_count = cursor.fetchone()[0]
-        
-        # Get export count
-        cursor.execute('SELECT COUNT(*) FROM export_history WHERE user_id = ?', (user_id,))
-        export_count = cursor.fetchone()[0]
-        
-        # Get last login
-        cursor.execute('SELECT last_login FROM users WHERE id = ?', (user_id,))
-        last_login = cursor.fetchone()[0]
-        
-        # Get most used simulation type
+        # Simulation count, export count, last login and most used simulation type in one statement
         cursor.execute('''
-            SELECT simulation_type, COUNT(*) as count
-            FROM simulation_history
-            WHERE user_id = ?
-            GROUP BY simulation_type
-            ORDER BY count DESC
-            LIMIT 1
-        ''', (user_id,))
+            SELECT
+                (SELECT COUNT(*) FROM simulation_history WHERE user_id = :uid),
+                (SELECT COUNT(*) FROM export_history WHERE user_id = :uid),
+                (SELECT last_login FROM users WHERE id = :uid),
+                (SELECT simulation_type
+                 FROM simulation_history
+                 WHERE user_id = :uid
+                 GROUP BY simulation_type
+                 ORDER BY COUNT(*) DESC
+                 LIMIT 1)
+        ''', {'uid': user_id})
         
-        favorite_simulation = cursor.fetchone()
-        
-        conn.close()
+        simulation_count, export_count, last_login, favorite_simulation = cursor.fetchone()
         
         return {
             'simulation_count': simulation_count,
             'export_count': export_count,
             'last_login': last_login,
-            'favorite_simulation': favorite_simulation[0] if favorite_simulation else 'None'
+            'favorite_simulation': favorite_simulation or 'None'
         }
 
 # Initialize database manager
 db_manager = DatabaseManager()
 
+# Cached per-user reads: the sidebar and analytics queries hit the DB at most once per TTL
+USER_DATA_TTL = 30  # seconds
+
+@st.cache_data(ttl=USER_DATA_TTL, show_spinner=False)
+def cached_user_stats(user_id):
+    """User stats reused for USER_DATA_TTL; the sidebar renders them on every rerun"""
+    return db_manager.get_user_stats(user_id)
+
+@st.cache_data(ttl=USER_DATA_TTL, show_spinner=False)
+def cached_export_history(user_id):
+    return db_manager.get_export_history(user_id)
+
+def clear_user_caches():
+    """Drop the cached per-user reads after a write that changes them (simulation saves, exports)"""
+    cached_user_stats.clear()
+    cached_export_history.clear()
+
 def get_user_stats_display(user_id):
     """Get formatted user stats for display"""
-    stats = db_manager.get_user_stats(user_id)
+    stats = cached_user_stats(user_id)
     
     col1, col2, col3, col4 = st.columns(4)
     
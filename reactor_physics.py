@@ -0,0 +1,48 @@
+# reactor_physics.py - Reactor output formulas (vectorized for parameter sweeps)
+import numpy as np
+
+# Optional JIT: numba turns the formulas into compiled ufuncs, plain NumPy broadcasting otherwise
+try:
+    from numba import vectorize, float64
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+OUTPUT_SCALE = 1000  # demo scale (GWh-ish per ton at 100% efficiency and availability)
+CO2_SAVED_PER_OUTPUT = 0.4  # placeholder metric
+BASE_COST_PER_MWH = 45
+COST_PER_MISSING_TON = 0.5
+
+def _yearly_output(fuel_input, efficiency, capacity_factor):
+    # Efficiency and capacity factor are percentages
+    return fuel_input * (efficiency / 100.0) * (capacity_factor / 100.0) * OUTPUT_SCALE
+
+def _fuel_utilization(efficiency, capacity_factor):
+    return efficiency * capacity_factor / 10000.0
+
+def _cost_per_mwh(fuel_input):
+    return BASE_COST_PER_MWH + (100 - fuel_input) * COST_PER_MISSING_TON
+
+if NUMBA_AVAILABLE:
+    yearly_output = vectorize([float64(float64, float64, float64)], cache=True)(_yearly_output)
+    fuel_utilization = vectorize([float64(float64, float64)], cache=True)(_fuel_utilization)
+    cost_per_mwh = vectorize([float64(float64)], cache=True)(_cost_per_mwh)
+else:
+    yearly_output = _yearly_output
+    fuel_utilization = _fuel_utilization
+    cost_per_mwh = _cost_per_mwh
+
+def reactor_outputs(fuel_input, efficiency, capacity_factor, run_time):
+    """Compute the reactor results; every argument may be a scalar or a broadcastable array"""
+    fuel_input, efficiency, capacity_factor = (
+        np.asarray(value, dtype=np.float64) for value in (fuel_input, efficiency, capacity_factor)
+    )
+    yearly = yearly_output(fuel_input, efficiency, capacity_factor)
+    total = yearly * run_time
+    return {
+        "yearly_output": yearly,
+        "total_output": total,
+        "co2_saved": total * CO2_SAVED_PER_OUTPUT,
+        "fuel_utilization": fuel_utilization(efficiency, capacity_factor),
+        "cost_per_mwh": cost_per_mwh(fuel_input)
+    }
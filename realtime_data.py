@@ -1,265 +1,413 @@
 # realtime_data.py - Real-time data integration and APIs
 import streamlit as st
 import requests
-import pandas as pd
+import numpy as np
 import json
-from datetime import datetime, timedelta
+import asyncio
+from functools import partial
 import time
-import plotly.express as px
-import plotly.graph_objects as go
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+import operator
+from types import MappingProxyType
 from database import db_manager
 
+# Display formats shared by the dashboard metrics
+_MW_FMT = "{:,} MW"
+_PCT_FMT = "{}%"
+_USD_BILLIONS_FMT = "${}B"
+_SHARE_FMT = "{:.1%}"  # 0-1 fraction shown as a percentage
+_SCORE_FMT = "{:.1f}/100"
+
+_iso_second = (0, "")  # last whole second seen by _now_iso and its formatted date and time
+
+def _now_iso():
+    """Local time in ISO 8601 with microseconds; the date and time part is formatted once per second"""
+    global _iso_second
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_second
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _iso_second = (second, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+# Simulated source payloads until the real APIs are wired in. Built once and shared: each fetch
+# returns a fresh top-level dict with its own timestamp that references the same nested sections,
+# so callers treat payloads as read-only
+_STATIC_ENERGY_DATA = MappingProxyType({
+    "total_generation": {
+        "thermal": 180000,  # MW
+        "hydro": 45000,
+        "nuclear": 6780,
+        "renewable": 120000,
+        "total": 351780
+    },
+    "demand": {
+        "peak_demand": 220000,  # MW
+        "current_demand": 195000,
+        "demand_supply_gap": 156780
+    },
+    "thorium_potential": {
+        "reserves": 360000,  # tons
+        "current_utilization": 0,
+        "potential_capacity": 500000  # MW
+    },
+    "emissions": {
+        "co2_emissions": 2500,  # MtCO2/year
+        "reduction_potential": 1800  # MtCO2/year with thorium
+    }
+})
+
+_STATIC_WEATHER_DATA = MappingProxyType({
+    "temperature": 28.5,  # Celsius
+    "humidity": 65,  # %
+    "wind_speed": 12.3,  # km/h
+    "solar_irradiance": 850,  # W/m²
+    "cloud_cover": 30,  # %
+    "renewable_potential": {
+        "solar_efficiency": 0.85,
+        "wind_efficiency": 0.75,
+        "optimal_conditions": True
+    }
+})
+
+_STATIC_ECONOMIC_DATA = MappingProxyType({
+    "currency": {
+        "usd_to_inr": 83.25,
+        "eur_to_inr": 90.15
+    },
+    "energy_prices": {
+        "crude_oil_usd_per_barrel": 78.50,
+        "natural_gas_usd_per_mbtu": 3.25,
+        "coal_usd_per_ton": 120.00,
+        "electricity_cost_inr_per_kwh": 6.50
+    },
+    "economic_indicators": {
+        "gdp_growth_rate": 6.8,  # %
+        "inflation_rate": 4.5,  # %
+        "unemployment_rate": 7.2,  # %
+        "energy_sector_contribution": 8.5  # % of GDP
+    },
+    "investment_opportunities": {
+        "renewable_energy_investment": 150,  # Billion USD
+        "nuclear_energy_investment": 25,
+        "thorium_research_funding": 2.5
+    }
+})
+
+_STATIC_GLOBAL_DATA = MappingProxyType({
+    "global_generation": {
+        "fossil_fuels": 63.5,  # % of global generation
+        "renewables": 28.2,
+        "nuclear": 8.3,
+        "total_capacity": 7500  # GW
+    },
+    "country_comparisons": {
+        "india": {
+            "total_capacity": 351.78,  # GW
+            "renewable_share": 34.1,  # %
+            "nuclear_share": 1.9,
+            "thorium_reserves_rank": 1
+        },
+        "china": {
+            "total_capacity": 2200,
+            "renewable_share": 45.2,
+            "nuclear_share": 4.9,
+            "thorium_reserves_rank": 2
+        },
+        "usa": {
+            "total_capacity": 1200,
+            "renewable_share": 22.1,
+            "nuclear_share": 19.7,
+            "thorium_reserves_rank": 3
+        }
+    },
+    "technology_trends": {
+        "thorium_research_investment": 5.2,  # Billion USD globally
+        "advanced_reactor_projects": 47,  # Number of projects
+        "fusion_energy_progress": 0.75,  # Progress score 0-1
+        "energy_storage_advancement": 0.65
+    }
+})
+
+# Recommendation rules as (insight, comparison, threshold, message), checked in order
+RECOMMENDATION_RULES = (
+    ("energy_security_score", operator.lt, 70, "Consider increasing thorium reactor deployment for energy security"),
+    ("renewable_potential", operator.gt, 80, "Excellent conditions for renewable energy expansion"),
+    ("economic_viability", operator.gt, 75, "Strong economic case for thorium energy investment"),
+)
+
+def calculate_insights_batch(total_generation, current_demand, renewable_generation, solar_efficiency,
+                             wind_efficiency, thorium_capacity, nuclear_generation, electricity_cost):
+    """Insight scores for many snapshots (cities, days) at once; every argument may be a scalar or a broadcastable array"""
+    (total_generation, current_demand, renewable_generation, solar_efficiency,
+     wind_efficiency, thorium_capacity, nuclear_generation, electricity_cost) = (
+        np.asarray(value, dtype=np.float64) for value in (
+            total_generation, current_demand, renewable_generation, solar_efficiency,
+            wind_efficiency, thorium_capacity, nuclear_generation, electricity_cost
+        )
+    )
+    # Generation shares are scaled by one reciprocal
+    inv_total = 1.0 / total_generation
+    return {
+        # Energy security (0-100): how far supply runs ahead of demand
+        "energy_security_score": np.clip((1 - current_demand * inv_total) * 100, 0, 100),
+        # Renewable share weighted by the average solar and wind efficiency
+        "renewable_potential": renewable_generation * inv_total * (solar_efficiency + wind_efficiency) / 2 * 100,
+        # Economic viability (0-100): (thorium / nuclear) * (10 / cost) * 10 as one division
+        "economic_viability": np.clip(100.0 * thorium_capacity / (nuclear_generation * electricity_cost), 0, 100)
+    }
+
 class RealTimeDataManager:
+    # Endpoint name -> (cache data type, cache key template, TTL in seconds, fetch method)
+    ENDPOINTS = {
+        "energy": ("energy", "india_energy_data", 3600, "_fetch_india_energy_data"),
+        "weather": ("weather", "weather_{city}", 1800, "_fetch_weather_data"),
+        "economic": ("economic", "economic_indicators", 7200, "_fetch_economic_indicators"),
+        "global": ("global", "global_energy_trends", 10800, "_fetch_global_energy_trends"),
+    }
+    
     def __init__(self):
-        self.cache_ttl = 3600  # 1 hour cache TTL
         self.api_keys = {
             'energy_api': st.secrets.get("ENERGY_API_KEY", ""),
             'weather_api': st.secrets.get("WEATHER_API_KEY", ""),
             'economic_api': st.secrets.get("ECONOMIC_API_KEY", "")
         }
-    
-    def get_india_energy_data(self):
-        """Get real-time India energy data"""
-        cache_key = "india_energy_data"
-        cached_data = db_manager.get_cached_energy_data("energy", cache_key)
-        
-        if cached_data:
-            return cached_data
         
-        try:
-            # Simulate API call to real energy data source
-            # In production, replace with actual API calls
-            energy_data = {
-                "timestamp": datetime.now().isoformat(),
-                "total_generation": {
-                    "thermal": 180000,  # MW
-                    "hydro": 45000,
-                    "nuclear": 6780,
-                    "renewable": 120000,
-                    "total": 351780
-                },
-                "demand": {
-                    "peak_demand": 220000,  # MW
-                    "current_demand": 195000,
-                    "demand_supply_gap": 156780
-                },
-                "thorium_potential": {
-                    "reserves": 360000,  # tons
-                    "current_utilization": 0,
-                    "potential_capacity": 500000  # MW
-                },
-                "emissions": {
-                    "co2_emissions": 2500,  # MtCO2/year
-                    "reduction_potential": 1800  # MtCO2/year with thorium
-                }
-            }
-            
-            # Cache the data
-            db_manager.cache_energy_data("energy", cache_key, energy_data, self.cache_ttl)
-            
-            return energy_data
-            
-        except Exception as e:
-            st.error(f"Error fetching energy data: {str(e)}")
-            return None
+        # Database cache writes run in the background so a fetch returns without waiting on SQLite;
+        # pending writes are flushed at exit
+        self._writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-writer")
+        atexit.register(self._writer.shutdown, wait=True)
     
-    def get_weather_data(self, city="New Delhi"):
-        """Get weather data for solar/wind energy calculations"""
-        cache_key = f"weather_{city}"
-        cached_data = db_manager.get_cached_energy_data("weather", cache_key)
+    def _load(self, name, **params):
+        """Serve an endpoint from the database cache, fetching and caching it on a miss (raises on failure)"""
+        data_type, key_template, ttl, fetch = self.ENDPOINTS[name]
+        cache_key = key_template.format(**params)
+        cached_data = db_manager.get_cached_energy_data(data_type, cache_key)
         
         if cached_data:
             return cached_data
         
-        try:
-            # Simulate weather API call
-            weather_data = {
-                "timestamp": datetime.now().isoformat(),
-                "city": city,
-                "temperature": 28.5,  # Celsius
-                "humidity": 65,  # %
-                "wind_speed": 12.3,  # km/h
-                "solar_irradiance": 850,  # W/m²
-                "cloud_cover": 30,  # %
-                "renewable_potential": {
-                    "solar_efficiency": 0.85,
-                    "wind_efficiency": 0.75,
-                    "optimal_conditions": True
-                }
-            }
-            
-            db_manager.cache_energy_data("weather", cache_key, weather_data, 1800)  # 30 min cache
-            
-            return weather_data
-            
-        except Exception as e:
-            st.error(f"Error fetching weather data: {str(e)}")
-            return None
+        data = getattr(self, fetch)(**params)
+        self._writer.submit(db_manager.cache_energy_data, data_type, cache_key, data, ttl_hours=ttl / 3600)
+        return data
     
-    def get_economic_indicators(self):
-        """Get economic indicators relevant to energy sector"""
-        cache_key = "economic_indicators"
-        cached_data = db_manager.get_cached_energy_data("economic", cache_key)
-        
-        if cached_data:
-            return cached_data
-        
-        try:
-            economic_data = {
-                "timestamp": datetime.now().isoformat(),
-                "currency": {
-                    "usd_to_inr": 83.25,
-                    "eur_to_inr": 90.15
-                },
-                "energy_prices": {
-                    "crude_oil_usd_per_barrel": 78.50,
-                    "natural_gas_usd_per_mbtu": 3.25,
-                    "coal_usd_per_ton": 120.00,
-                    "electricity_cost_inr_per_kwh": 6.50
-                },
-                "economic_indicators": {
-                    "gdp_growth_rate": 6.8,  # %
-                    "inflation_rate": 4.5,  # %
-                    "unemployment_rate": 7.2,  # %
-                    "energy_sector_contribution": 8.5  # % of GDP
-                },
-                "investment_opportunities": {
-                    "renewable_energy_investment": 150,  # Billion USD
-                    "nuclear_energy_investment": 25,
-                    "thorium_research_funding": 2.5
-                }
-            }
-            
-            db_manager.cache_energy_data("economic", cache_key, economic_data, 7200)  # 2 hour cache
-            
-            return economic_data
-            
-        except Exception as e:
-            st.error(f"Error fetching economic data: {str(e)}")
+    def _fetch_india_energy_data(self):
+        """Fetch real-time India energy data"""
+        # Simulate API call to real energy data source
+        # In production, replace with actual API calls
+        return {"timestamp": _now_iso(), **_STATIC_ENERGY_DATA}
+    
+    def _fetch_weather_data(self, city="New Delhi"):
+        """Fetch weather data for solar/wind energy calculations"""
+        # Simulate weather API call
+        return {"timestamp": _now_iso(), "city": city, **_STATIC_WEATHER_DATA}
+    
+    def _fetch_economic_indicators(self):
+        """Fetch economic indicators relevant to energy sector"""
+        return {"timestamp": _now_iso(), **_STATIC_ECONOMIC_DATA}
+    
+    def _fetch_global_energy_trends(self):
+        """Fetch global energy trends and comparisons"""
+        return {"timestamp": _now_iso(), **_STATIC_GLOBAL_DATA}
+    
+    def _checked(self, label, result):
+        """The fetched data, or None once a failed fetch's exception has been reported"""
+        if isinstance(result, Exception):
+            # Reported on the script thread, where st.error can reach the page
+            st.error(f"Error fetching {label} data: {str(result)}")
             return None
+        return result
     
-    def get_global_energy_trends(self):
-        """Get global energy trends and comparisons"""
-        cache_key = "global_energy_trends"
-        cached_data = db_manager.get_cached_energy_data("global", cache_key)
+    def _fetch_concurrently(self, sources):
+        """Run (label, loader) pairs at once in worker threads; a failed source is reported and returned as None"""
+        async def gather():
+            return await asyncio.gather(*[asyncio.to_thread(loader) for _, loader in sources], return_exceptions=True)
         
-        if cached_data:
-            return cached_data
-        
-        try:
-            global_data = {
-                "timestamp": datetime.now().isoformat(),
-                "global_generation": {
-                    "fossil_fuels": 63.5,  # % of global generation
-                    "renewables": 28.2,
-                    "nuclear": 8.3,
-                    "total_capacity": 7500  # GW
-                },
-                "country_comparisons": {
-                    "india": {
-                        "total_capacity": 351.78,  # GW
-                        "renewable_share": 34.1,  # %
-                        "nuclear_share": 1.9,
-                        "thorium_reserves_rank": 1
-                    },
-                    "china": {
-                        "total_capacity": 2200,
-                        "renewable_share": 45.2,
-                        "nuclear_share": 4.9,
-                        "thorium_reserves_rank": 2
-                    },
-                    "usa": {
-                        "total_capacity": 1200,
-                        "renewable_share": 22.1,
-                        "nuclear_share": 19.7,
-                        "thorium_reserves_rank": 3
-                    }
-                },
-                "technology_trends": {
-                    "thorium_research_investment": 5.2,  # Billion USD globally
-                    "advanced_reactor_projects": 47,  # Number of projects
-                    "fusion_energy_progress": 0.75,  # Progress score 0-1
-                    "energy_storage_advancement": 0.65
-                }
-            }
-            
-            db_manager.cache_energy_data("global", cache_key, global_data, 10800)  # 3 hour cache
-            
-            return global_data
-            
-        except Exception as e:
-            st.error(f"Error fetching global data: {str(e)}")
-            return None
+        return [self._checked(label, result) for (label, _), result in zip(sources, asyncio.run(gather()))]
+    
+    def fetch_as_completed(self, sources, on_result):
+        """Run (label, loader) pairs at once in worker threads, calling on_result(index, result) on the script
+        thread as each one finishes, fastest first; a failed source's result is the exception it raised"""
+        async def run(index, loader):
+            try:
+                return index, await asyncio.to_thread(loader)
+            except Exception as e:
+                return index, e
+        
+        async def consume():
+            for next_done in asyncio.as_completed([run(index, loader) for index, (_, loader) in enumerate(sources)]):
+                on_result(*await next_done)
+        
+        asyncio.run(consume())
+    
+    def sources(self, city="New Delhi"):
+        """(label, loader) pairs for the energy, weather, economic and global data"""
+        return [
+            ("energy", cached_india_energy_data),
+            ("weather", partial(cached_weather_data, city)),
+            ("economic", cached_economic_indicators),
+            ("global", cached_global_energy_trends),
+        ]
+    
+    def fetch_insight_inputs(self, city="New Delhi"):
+        """The energy, weather and economic data the insights need, fetched concurrently"""
+        return self._fetch_concurrently(self.sources(city)[:3])
     
     def calculate_real_time_insights(self, energy_data, weather_data, economic_data):
         """Calculate real-time insights from multiple data sources"""
-        if not all([energy_data, weather_data, economic_data]):
+        if not (energy_data and weather_data and economic_data):
             return None
         
-        insights = {
-            "timestamp": datetime.now().isoformat(),
-            "energy_security_score": 0,
-            "renewable_potential": 0,
-            "economic_viability": 0,
-            "recommendations": []
-        }
-        
-        # Calculate energy security score
-        demand_supply_ratio = energy_data["demand"]["current_demand"] / energy_data["total_generation"]["total"]
-        insights["energy_security_score"] = min(100, (1 - demand_supply_ratio) * 100)
-        
-        # Calculate renewable potential
-        renewable_share = energy_data["total_generation"]["renewable"] / energy_data["total_generation"]["total"]
-        weather_factor = (weather_data["renewable_potential"]["solar_efficiency"] + 
-                         weather_data["renewable_potential"]["wind_efficiency"]) / 2
-        insights["renewable_potential"] = (renewable_share * weather_factor) * 100
-        
-        # Calculate economic viability
-        thorium_potential = energy_data["thorium_potential"]["potential_capacity"]
-        current_nuclear = energy_data["total_generation"]["nuclear"]
-        cost_factor = 1 / (economic_data["energy_prices"]["electricity_cost_inr_per_kwh"] / 10)
-        insights["economic_viability"] = min(100, (thorium_potential / current_nuclear) * cost_factor * 10)
+        # A single snapshot is a batch of one
+        generation = energy_data["total_generation"]
+        weather_potential = weather_data["renewable_potential"]
+        scores = calculate_insights_batch(
+            generation["total"],
+            energy_data["demand"]["current_demand"],
+            generation["renewable"],
+            weather_potential["solar_efficiency"],
+            weather_potential["wind_efficiency"],
+            energy_data["thorium_potential"]["potential_capacity"],
+            generation["nuclear"],
+            economic_data["energy_prices"]["electricity_cost_inr_per_kwh"]
+        )
+        
+        insights = {"timestamp": _now_iso()}
+        insights.update((key, float(score)) for key, score in scores.items())
         
         # Generate recommendations
-        if insights["energy_security_score"] < 70:
-            insights["recommendations"].append("Consider increasing thorium reactor deployment for energy security")
-        
-        if insights["renewable_potential"] > 80:
-            insights["recommendations"].append("Excellent conditions for renewable energy expansion")
-        
-        if insights["economic_viability"] > 75:
-            insights["recommendations"].append("Strong economic case for thorium energy investment")
+        insights["recommendations"] = [
+            message for key, compare, threshold, message in RECOMMENDATION_RULES
+            if compare(insights[key], threshold)
+        ]
         
         return insights
 
 # Initialize real-time data manager
 rt_data_manager = RealTimeDataManager()
 
+# In-process tier in front of the database cache, with the same TTLs: reruns and other sessions
+# skip the SQLite lookup and JSON decode. A loader that raises is not cached. Weather is keyed by
+# city, so its entries are capped and the least recently used city is evicted first. st.cache_data
+# locks each key while its value is computed, so sessions that miss the same key together wait
+# for the one fetch in flight instead of each calling the source: at most one fetch per key.
+_ENDPOINTS = RealTimeDataManager.ENDPOINTS
+
+@st.cache_data(ttl=_ENDPOINTS["energy"][2], show_spinner=False)
+def cached_india_energy_data():
+    return rt_data_manager._load("energy")
+
+@st.cache_data(ttl=_ENDPOINTS["weather"][2], max_entries=128, show_spinner=False)
+def cached_weather_data(city):
+    return rt_data_manager._load("weather", city=city)
+
+@st.cache_data(ttl=_ENDPOINTS["economic"][2], show_spinner=False)
+def cached_economic_indicators():
+    return rt_data_manager._load("economic")
+
+@st.cache_data(ttl=_ENDPOINTS["global"][2], show_spinner=False)
+def cached_global_energy_trends():
+    return rt_data_manager._load("global")
+
+# Generation sources in chart order; the payloads' trailing total entries are left out
+_GEN_LABELS = ("thermal", "hydro", "nuclear", "renewable")
+_GLOBAL_LABELS = ("fossil_fuels", "renewables", "nuclear")
+
+# Figures are pure functions of their data dict: reruns with unchanged data reuse the built figure
+@st.cache_data(ttl=1800, show_spinner=False)
+def build_generation_pie(generation_data):
+    """Pie chart of India's generation mix"""
+    import plotly.express as px
+    values = [generation_data[key] for key in _GEN_LABELS]
+    
+    fig = px.pie(values=values, names=list(_GEN_LABELS), 
+                title="India's Energy Generation Mix",
+                color_discrete_sequence=px.colors.qualitative.Set3)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def build_efficiency_gauge(renewable_data):
+    """Gauge of the average solar and wind efficiency"""
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = (renewable_data["solar_efficiency"] + renewable_data["wind_efficiency"]) / 2 * 100,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Renewable Efficiency (%)"},
+        delta = {'reference': 80},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 50], 'color': "lightgray"},
+                {'range': [50, 80], 'color': "yellow"},
+                {'range': [80, 100], 'color': "green"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    
+    fig.update_layout(height=300)
+    return fig
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def build_global_bar(global_gen):
+    """Bar chart of the global generation mix"""
+    import plotly.express as px
+    fig = px.bar(
+        x=list(_GLOBAL_LABELS),
+        y=[global_gen[key] for key in _GLOBAL_LABELS],
+        title="Global Energy Generation Mix (%)",
+        color=list(_GLOBAL_LABELS),
+        color_discrete_sequence=px.colors.qualitative.Set2
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def build_country_comparison(country_data):
+    """Country comparison table with one typed column per metric"""
+    import pandas as pd
+    rows = country_data.values()
+    return pd.DataFrame({
+        'total_capacity': np.array([row['total_capacity'] for row in rows], dtype=np.float64),
+        'renewable_share': np.array([row['renewable_share'] for row in rows], dtype=np.float64),
+        'nuclear_share': np.array([row['nuclear_share'] for row in rows], dtype=np.float64),
+        'thorium_reserves_rank': np.array([row['thorium_reserves_rank'] for row in rows], dtype=np.int8)
+    }, index=list(country_data.keys()))
+
 def show_realtime_dashboard():
     """Display real-time data dashboard"""
     st.markdown("### 🌐 Real-Time Energy Dashboard")
     
     # Create tabs for different data views
-    tab1, tab2, tab3, tab4 = st.tabs([
+    tabs = st.tabs([
         "⚡ India Energy", "🌤️ Weather Impact", "💰 Economic Indicators", "🌍 Global Trends"
     ])
     
-    with tab1:
-        show_india_energy_tab()
+    # All four sources are fetched together; each tab shows a loading note until its own source
+    # arrives and is filled in as soon as that fetch finishes, instead of after the slowest one
+    placeholders = [tab.empty() for tab in tabs]
+    for placeholder in placeholders:
+        placeholder.info("⏳ Loading live data...")
     
-    with tab2:
-        show_weather_impact_tab()
+    sources = rt_data_manager.sources()
+    renderers = (show_india_energy_tab, show_weather_impact_tab, show_economic_indicators_tab, show_global_trends_tab)
     
-    with tab3:
-        show_economic_indicators_tab()
+    def render(index, result):
+        with placeholders[index].container():
+            renderers[index](rt_data_manager._checked(sources[index][0], result))
     
-    with tab4:
-        show_global_trends_tab()
+    rt_data_manager.fetch_as_completed(sources, render)
 
-def show_india_energy_tab():
+def show_india_energy_tab(energy_data):
     """Show India energy data"""
-    energy_data = rt_data_manager.get_india_energy_data()
-    
     if energy_data:
         col1, col2 = st.columns(2)
         
@@ -267,15 +415,7 @@ def show_india_energy_tab():
             st.markdown("#### 📊 Current Generation Mix")
             generation_data = energy_data["total_generation"]
             
-            # Create pie chart
-            labels = list(generation_data.keys())[:-1]  # Exclude total
-            values = [generation_data[key] for key in labels]
-            
-            fig = px.pie(values=values, names=labels, 
-                        title="India's Energy Generation Mix",
-                        color_discrete_sequence=px.colors.qualitative.Set3)
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_generation_pie(generation_data), use_container_width=True)
         
         with col2:
             st.markdown("#### ⚡ Demand vs Supply")
@@ -283,12 +423,12 @@ def show_india_energy_tab():
             
             metrics_col1, metrics_col2 = st.columns(2)
             with metrics_col1:
-                st.metric("Current Demand", f"{demand_data['current_demand']:,} MW")
-                st.metric("Peak Demand", f"{demand_data['peak_demand']:,} MW")
+                st.metric("Current Demand", _MW_FMT.format(demand_data['current_demand']))
+                st.metric("Peak Demand", _MW_FMT.format(demand_data['peak_demand']))
             
             with metrics_col2:
-                st.metric("Supply", f"{generation_data['total']:,} MW")
-                st.metric("Surplus", f"{demand_data['demand_supply_gap']:,} MW")
+                st.metric("Supply", _MW_FMT.format(generation_data['total']))
+                st.metric("Surplus", _MW_FMT.format(demand_data['demand_supply_gap']))
         
         # Thorium potential
         st.markdown("#### ⚛️ Thorium Energy Potential")
@@ -298,9 +438,9 @@ def show_india_energy_tab():
         with col1:
             st.metric("Thorium Reserves", f"{thorium_data['reserves']:,} tons")
         with col2:
-            st.metric("Potential Capacity", f"{thorium_data['potential_capacity']:,} MW")
+            st.metric("Potential Capacity", _MW_FMT.format(thorium_data['potential_capacity']))
         with col3:
-            st.metric("Current Utilization", f"{thorium_data['current_utilization']} MW")
+            st.metric("Current Utilization", _MW_FMT.format(thorium_data['current_utilization']))
         
         # Emissions data
         st.markdown("#### 🌱 Emissions Impact")
@@ -312,10 +452,8 @@ def show_india_energy_tab():
         with col2:
             st.metric("Reduction Potential", f"{emissions_data['reduction_potential']:,} MtCO₂/year")
 
-def show_weather_impact_tab():
+def show_weather_impact_tab(weather_data):
     """Show weather impact on renewable energy"""
-    weather_data = rt_data_manager.get_weather_data()
-    
     if weather_data:
         col1, col2 = st.columns(2)
         
@@ -325,7 +463,7 @@ def show_weather_impact_tab():
             metrics_col1, metrics_col2 = st.columns(2)
             with metrics_col1:
                 st.metric("Temperature", f"{weather_data['temperature']}°C")
-                st.metric("Humidity", f"{weather_data['humidity']}%")
+                st.metric("Humidity", _PCT_FMT.format(weather_data['humidity']))
             
             with metrics_col2:
                 st.metric("Wind Speed", f"{weather_data['wind_speed']} km/h")
@@ -335,31 +473,7 @@ def show_weather_impact_tab():
             st.markdown("#### ⚡ Renewable Energy Efficiency")
             renewable_data = weather_data["renewable_potential"]
             
-            # Create gauge chart for efficiency
-            fig = go.Figure(go.Indicator(
-                mode = "gauge+number+delta",
-                value = (renewable_data["solar_efficiency"] + renewable_data["wind_efficiency"]) / 2 * 100,
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                title = {'text': "Renewable Efficiency (%)"},
-                delta = {'reference': 80},
-                gauge = {
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkblue"},
-                    'steps': [
-                        {'range': [0, 50], 'color': "lightgray"},
-                        {'range': [50, 80], 'color': "yellow"},
-                        {'range': [80, 100], 'color': "green"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 90
-                    }
-                }
-            ))
-            
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_efficiency_gauge(renewable_data), use_container_width=True)
         
         # Recommendations
         if weather_data["renewable_potential"]["optimal_conditions"]:
@@ -367,10 +481,8 @@ def show_weather_impact_tab():
         else:
             st.warning("⚠️ **Sub-optimal Conditions**: Weather may impact renewable energy efficiency")
 
-def show_economic_indicators_tab():
+def show_economic_indicators_tab(economic_data):
     """Show economic indicators"""
-    economic_data = rt_data_manager.get_economic_indicators()
-    
     if economic_data:
         col1, col2 = st.columns(2)
         
@@ -396,12 +508,12 @@ def show_economic_indicators_tab():
             
             col1, col2 = st.columns(2)
             with col1:
-                st.metric("GDP Growth", f"{indicators['gdp_growth_rate']}%")
-                st.metric("Inflation Rate", f"{indicators['inflation_rate']}%")
+                st.metric("GDP Growth", _PCT_FMT.format(indicators['gdp_growth_rate']))
+                st.metric("Inflation Rate", _PCT_FMT.format(indicators['inflation_rate']))
             
             with col2:
-                st.metric("Unemployment", f"{indicators['unemployment_rate']}%")
-                st.metric("Energy Sector GDP", f"{indicators['energy_sector_contribution']}%")
+                st.metric("Unemployment", _PCT_FMT.format(indicators['unemployment_rate']))
+                st.metric("Energy Sector GDP", _PCT_FMT.format(indicators['energy_sector_contribution']))
         
         # Investment opportunities
         st.markdown("#### 💰 Investment Opportunities")
@@ -409,16 +521,14 @@ def show_economic_indicators_tab():
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Renewable Energy", f"${investment_data['renewable_energy_investment']}B")
+            st.metric("Renewable Energy", _USD_BILLIONS_FMT.format(investment_data['renewable_energy_investment']))
         with col2:
-            st.metric("Nuclear Energy", f"${investment_data['nuclear_energy_investment']}B")
+            st.metric("Nuclear Energy", _USD_BILLIONS_FMT.format(investment_data['nuclear_energy_investment']))
         with col3:
-            st.metric("Thorium Research", f"${investment_data['thorium_research_funding']}B")
+            st.metric("Thorium Research", _USD_BILLIONS_FMT.format(investment_data['thorium_research_funding']))
 
-def show_global_trends_tab():
+def show_global_trends_tab(global_data):
     """Show global energy trends"""
-    global_data = rt_data_manager.get_global_energy_trends()
-    
     if global_data:
         col1, col2 = st.columns(2)
         
@@ -427,26 +537,14 @@ def show_global_trends_tab():
             
             global_gen = global_data["global_generation"]
             
-            # Bar chart for global generation
-            fig = px.bar(
-                x=list(global_gen.keys())[:-1],  # Exclude total
-                y=[global_gen[key] for key in list(global_gen.keys())[:-1]],
-                title="Global Energy Generation Mix (%)",
-                color=list(global_gen.keys())[:-1],
-                color_discrete_sequence=px.colors.qualitative.Set2
-            )
-            fig.update_layout(showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_global_bar(global_gen), use_container_width=True)
         
         with col2:
             st.markdown("#### 🏆 Country Comparison")
             
             country_data = global_data["country_comparisons"]
             
-            comparison_df = pd.DataFrame(country_data).T
-            comparison_df = comparison_df[['total_capacity', 'renewable_share', 'nuclear_share', 'thorium_reserves_rank']]
-            
-            st.dataframe(comparison_df, use_container_width=True)
+            st.dataframe(build_country_comparison(country_data), use_container_width=True)
         
         # Technology trends
         st.markdown("#### 🚀 Technology Trends")
@@ -454,21 +552,19 @@ def show_global_trends_tab():
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Thorium Research", f"${tech_data['thorium_research_investment']}B")
+            st.metric("Thorium Research", _USD_BILLIONS_FMT.format(tech_data['thorium_research_investment']))
         with col2:
             st.metric("Advanced Reactors", f"{tech_data['advanced_reactor_projects']}")
         with col3:
-            st.metric("Fusion Progress", f"{tech_data['fusion_energy_progress']*100:.1f}%")
+            st.metric("Fusion Progress", _SHARE_FMT.format(tech_data['fusion_energy_progress']))
         with col4:
-            st.metric("Storage Advancement", f"{tech_data['energy_storage_advancement']*100:.1f}%")
+            st.metric("Storage Advancement", _SHARE_FMT.format(tech_data['energy_storage_advancement']))
 
 def show_realtime_insights():
     """Show real-time insights combining all data sources"""
     st.markdown("### 🧠 Real-Time Insights")
     
-    energy_data = rt_data_manager.get_india_energy_data()
-    weather_data = rt_data_manager.get_weather_data()
-    economic_data = rt_data_manager.get_economic_indicators()
+    energy_data, weather_data, economic_data = rt_data_manager.fetch_insight_inputs()
     
     insights = rt_data_manager.calculate_real_time_insights(energy_data, weather_data, economic_data)
     
@@ -476,11 +572,11 @@ def show_realtime_insights():
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("Energy Security Score", f"{insights['energy_security_score']:.1f}/100")
+            st.metric("Energy Security Score", _SCORE_FMT.format(insights['energy_security_score']))
         with col2:
-            st.metric("Renewable Potential", f"{insights['renewable_potential']:.1f}/100")
+            st.metric("Renewable Potential", _SCORE_FMT.format(insights['renewable_potential']))
         with col3:
-            st.metric("Economic Viability", f"{insights['economic_viability']:.1f}/100")
+            st.metric("Economic Viability", _SCORE_FMT.format(insights['economic_viability']))
         
         if insights["recommendations"]:
             st.markdown("#### 💡 Recommendations")
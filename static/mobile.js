@@ -0,0 +1,13 @@
+// Mark touch-first devices by their primary pointer rather than the user agent (iPadOS reports itself as a Mac)
+document.body.classList.toggle('mobile-device', matchMedia('(pointer: coarse)').matches);
+
+// Handle orientation change: one trailing resize per rotation burst, so charts re-layout once
+var resizeTimer = null;
+window.addEventListener('orientationchange', function() {
+    clearTimeout(resizeTimer);
+    resizeTimer = setTimeout(function() {
+        requestAnimationFrame(function() {
+            window.dispatchEvent(new Event('resize'));
+        });
+    }, 100);
+});
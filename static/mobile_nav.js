@@ -0,0 +1,7 @@
+function scrollToSection(section) {
+    const element = document.querySelector('[data-testid="stTabs"]');
+    if (element) {
+        element.scrollIntoView({ behavior: 'smooth' });
+    }
+}
+